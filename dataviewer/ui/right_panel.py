@@ -53,6 +53,13 @@ class RightPanel(QtWidgets.QFrame):
         self._build_heading_tab()
         self._build_notes_tab()
 
+        # latest heading per widget, applied at most 30 times per second
+        self._pending = {"vessel": None, "rov1": None, "rov2": None}
+        self._heading_timer = QtCore.QTimer(self)
+        self._heading_timer.setInterval(33)
+        self._heading_timer.setSingleShot(False)
+        self._heading_timer.timeout.connect(self._flush_headings)
+
         self.btn_close.clicked.connect(self.closeRequested.emit)
 
     def _build_info_tab(self):
@@ -141,14 +148,38 @@ class RightPanel(QtWidgets.QFrame):
     def set_heading_series(self, vessel=None, rov1=None, rov2=None, x=None, autorange=False):
         return
 
+    def _queue_heading(self, key: str, hdg: float):
+        if hdg is None:
+            return
+        self._pending[key] = hdg
+        if not self._heading_timer.isActive():
+            self._heading_timer.start()
+
+    def _flush_headings(self):
+        views = (
+            ("vessel", getattr(self, "vessel_svg", None)),
+            ("rov1", getattr(self, "rov1_svg", None)),
+            ("rov2", getattr(self, "rov2_svg", None)),
+        )
+        applied = False
+        for key, view in views:
+            hdg = self._pending.get(key)
+            if hdg is None:
+                continue
+            self._pending[key] = None
+            if view:
+                view.set_heading_deg(hdg)
+            applied = True
+
+        # nothing arrived since the last tick -> stop until the next sample
+        if not applied:
+            self._heading_timer.stop()
+
     def set_vessel_heading(self, hdg: float):
-        if hasattr(self, "vessel_svg") and self.vessel_svg:
-            self.vessel_svg.set_heading_deg(hdg)
+        self._queue_heading("vessel", hdg)
 
     def set_rov1_heading(self, hdg: float):
-        if hasattr(self, "rov1_svg") and self.rov1_svg:
-            self.rov1_svg.set_heading_deg(hdg)
+        self._queue_heading("rov1", hdg)
 
     def set_rov2_heading(self, hdg: float):
-        if hasattr(self, "rov2_svg") and self.rov2_svg:
-            self.rov2_svg.set_heading_deg(hdg)
+        self._queue_heading("rov2", hdg)
@@ -1,6 +1,15 @@
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtSvgWidgets import QGraphicsSvgItem
 
+from .svg_cache import get_renderer
+
+
+def _make_item(svg_path: str) -> QGraphicsSvgItem:
+    # views showing the same file share one parsed renderer
+    item = QGraphicsSvgItem()
+    item.setSharedRenderer(get_renderer(svg_path))
+    return item
+
 
 class RotatingSvgView(QtWidgets.QGraphicsView):
     """
@@ -30,15 +39,19 @@ class RotatingSvgView(QtWidgets.QGraphicsView):
 
         self._bg_item = None
         if bg_svg_path:
-            self._bg_item = QGraphicsSvgItem(bg_svg_path)
+            self._bg_item = _make_item(bg_svg_path)
+            # the background never rotates: keep it as a device-resolution bitmap that is
+            # only re-rendered when the view is refitted, and stays sharp at any size
+            self._bg_item.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
             self._bg_item.setZValue(0)
             self._scene.addItem(self._bg_item)
 
-        self._fg_item = QGraphicsSvgItem(fg_svg_path)
+        self._fg_item = _make_item(fg_svg_path)
         self._fg_item.setZValue(10)
         self._scene.addItem(self._fg_item)
 
         self._last_angle = None
+        self._last_fit_size = QtCore.QSize()
         self._fg_scale = float(fg_scale)
         self._bg_scale = float(bg_scale)
 
@@ -83,7 +96,17 @@ class RotatingSvgView(QtWidgets.QGraphicsView):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+
+        # scene rect is fixed after _recenter_and_scale; only refit on a real size change
+        sz = event.size()
+        if (
+            abs(sz.width() - self._last_fit_size.width()) < 4
+            and abs(sz.height() - self._last_fit_size.height()) < 4
+        ):
+            return
+
         self.fitInView(self._scene.sceneRect(), QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+        self._last_fit_size = QtCore.QSize(sz)
 
     def set_heading_deg(self, hdg: float, *, offset_deg: float = 0.0, invert: bool = False):
         if hdg is None:
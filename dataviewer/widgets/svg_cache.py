@@ -0,0 +1,13 @@
+from PySide6.QtSvg import QSvgRenderer
+
+
+# path -> renderer; the same SVG files are used by several views
+_RENDERER_CACHE: dict[str, QSvgRenderer] = {}
+
+
+def get_renderer(path: str) -> QSvgRenderer:
+    r = _RENDERER_CACHE.get(path)
+    if r is None:
+        r = QSvgRenderer(path)
+        _RENDERER_CACHE[path] = r
+    return r
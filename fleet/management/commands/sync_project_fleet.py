@@ -48,6 +48,15 @@ ON CONFLICT(source_vessel_id) DO UPDATE SET
     updated_at=excluded.updated_at
 """
 
+BATCH_SIZE = 1000
+FETCH_CHUNK_SIZE = 2000
+
+# order matches the UPSERT_SQL placeholders (id -> source_vessel_id)
+VESSEL_FIELDS = (
+    "name", "imo", "mmsi", "call_sign", "vessel_type", "owner",
+    "is_active", "is_retired", "notes", "id", "created_at",
+)
+
 
 class Command(BaseCommand):
     help = "Copy/sync master Vessel list from Django into a project's ProjectDB table project_fleet."
@@ -80,26 +89,38 @@ class Command(BaseCommand):
             cur = conn.cursor()
             cur.executescript(PROJECT_FLEET_SCHEMA)
 
+            # all batches go into one transaction, committed once below
+
             rows = 0
-            for v in qs.iterator():
-                cur.execute(
-                    UPSERT_SQL,
+            batch = []
+            for (
+                name, imo, mmsi, call_sign, vessel_type, owner,
+                is_active, is_retired, notes, pk, created_at,
+            ) in qs.values_list(*VESSEL_FIELDS).iterator(chunk_size=FETCH_CHUNK_SIZE):
+                batch.append(
                     (
-                        v.name,
-                        v.imo,
-                        v.mmsi,
-                        v.call_sign,
-                        v.vessel_type,
-                        v.owner,
-                        1 if v.is_active else 0,
-                        1 if v.is_retired else 0,
-                        v.notes,
-                        v.id,
-                        v.created_at.isoformat(timespec="seconds") if v.created_at else now,
+                        name,
+                        imo,
+                        mmsi,
+                        call_sign,
+                        vessel_type,
+                        owner,
+                        int(bool(is_active)),
+                        int(bool(is_retired)),
+                        notes,
+                        pk,
+                        created_at.isoformat(timespec="seconds") if created_at else now,
                         now,
-                    ),
+                    )
                 )
-                rows += 1
+                if len(batch) >= BATCH_SIZE:
+                    cur.executemany(UPSERT_SQL, batch)
+                    rows += len(batch)
+                    batch.clear()
+
+            if batch:
+                cur.executemany(UPSERT_SQL, batch)
+                rows += len(batch)
 
             conn.commit()
         finally:
@@ -0,0 +1,73 @@
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+
+from .models import Vessel
+from .utils import import_vessels_from_csv_if_missing
+
+
+CSV_HEADER = "Name,Type,IMO,MMSI,Call,Owner,Active,Retired\n"
+
+
+class ImportVesselsFromCsvTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.base_dir = Path(tmp.name)
+        settings_override = override_settings(BASE_DIR=self.base_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def _import(self, *rows):
+        csv_text = CSV_HEADER + "".join(r + "\n" for r in rows)
+        (self.base_dir / "vessels.csv").write_text(csv_text, encoding="utf-8")
+        return import_vessels_from_csv_if_missing("vessels.csv")
+
+    def test_creates_new_vessels(self):
+        result = self._import(
+            "Alpha,Source,1111111,211000001,AAAA,Acme,yes,no",
+            "Bravo,Node,,,,,1,0",
+        )
+        self.assertEqual(result["created"], 2)
+        self.assertEqual(result["skipped"], 0)
+        self.assertEqual(sorted(result["created_names"]), ["Alpha", "Bravo"])
+        bravo = Vessel.objects.get(name="Bravo")
+        self.assertIsNone(bravo.imo)
+        self.assertIsNone(bravo.mmsi)
+
+    def test_duplicate_mmsi_rows_in_csv(self):
+        result = self._import(
+            "Alpha,Source,,211000001,,,1,0",
+            "Alpha II,Source,,211000001,,,1,0",
+        )
+        self.assertEqual(result["created_names"], ["Alpha"])
+        self.assertEqual(result["skipped_names"], ["Alpha II"])
+        self.assertEqual(Vessel.objects.filter(mmsi="211000001").count(), 1)
+
+    def test_duplicate_name_rows_in_csv_ignore_case(self):
+        result = self._import(
+            "Alpha,Source,1111111,,,,1,0",
+            "ALPHA,Source,2222222,,,,1,0",
+        )
+        self.assertEqual(result["created"], 1)
+        self.assertEqual(result["skipped_names"], ["ALPHA"])
+        self.assertFalse(Vessel.objects.filter(imo="2222222").exists())
+
+    def test_existing_vessels_are_skipped(self):
+        Vessel.objects.create(name="Alpha", imo="1111111")
+        Vessel.objects.create(name="Bravo", mmsi="211000002")
+        result = self._import(
+            "alpha,Source,,,,,1,0",
+            "Renamed,Source,1111111,,,,1,0",
+            "Bravo 2,Node,,211000002,,,1,0",
+            "Charlie,Node,,,,,1,0",
+        )
+        self.assertEqual(result["created_names"], ["Charlie"])
+        self.assertEqual(sorted(result["skipped_names"]), ["Bravo 2", "Renamed", "alpha"])
+        self.assertEqual(Vessel.objects.count(), 3)
+
+    def test_missing_columns(self):
+        (self.base_dir / "vessels.csv").write_text("Name,IMO\nAlpha,1\n", encoding="utf-8")
+        with self.assertRaises(ValueError):
+            import_vessels_from_csv_if_missing("vessels.csv")
@@ -1,5 +1,17 @@
 from django.urls import path
-from .views import *
+from .views import (
+    vessel_page,
+    api_vessel_list,
+    api_vessel_create,
+    api_vessel_update,
+    api_vessel_delete,
+    api_import_fleet_from_csv,
+    sequence_assignments_page,
+    api_seq_assign_list,
+    api_seq_assign_add,
+    api_seq_assign_update,
+    api_seq_assign_delete,
+)
 
 app_name = "fleet"
 
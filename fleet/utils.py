@@ -2,18 +2,21 @@ import csv
 from pathlib import Path
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
 
 from .models import Vessel
 
 
+_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE = frozenset({"0", "false", "no", "n", "off"})
+
+
 def _to_bool(v, default=False) -> bool:
     if v is None:
         return default
-    s = str(v).strip().lower()
-    if s in ("1", "true", "yes", "y", "on"):
+    s = v.strip().lower() if isinstance(v, str) else str(v).strip().lower()
+    if s in _TRUE:
         return True
-    if s in ("0", "false", "no", "n", "off"):
+    if s in _FALSE:
         return False
     return default
 
@@ -28,6 +31,7 @@ def import_vessels_from_csv_if_missing(csv_rel_path="fleet/vessels_list.csv"):
     Loads vessels from a CSV file and creates ONLY missing rows.
     Existing vessels are detected by:
       - IMO (if provided) OR
+      - MMSI (if provided) OR
       - name (case-insensitive)
 
     Returns dict with counts and skipped list.
@@ -36,9 +40,7 @@ def import_vessels_from_csv_if_missing(csv_rel_path="fleet/vessels_list.csv"):
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    created = 0
     skipped = 0
-    created_names = []
     skipped_names = []
 
     with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
@@ -49,6 +51,17 @@ def import_vessels_from_csv_if_missing(csv_rel_path="fleet/vessels_list.csv"):
         if missing_cols:
             raise ValueError(f"CSV missing columns: {sorted(missing_cols)}")
 
+        # one query each instead of an exists() round trip per CSV row
+        existing_imos = set(
+            Vessel.objects.exclude(imo__isnull=True).exclude(imo="").values_list("imo", flat=True)
+        )
+        existing_mmsis = set(
+            Vessel.objects.exclude(mmsi__isnull=True).exclude(mmsi="").values_list("mmsi", flat=True)
+        )
+        existing_raw_names = set(Vessel.objects.values_list("name", flat=True))
+        existing_names = {n.casefold() for n in existing_raw_names}
+
+        new_objs = []
         for row in reader:
             name = _norm(row.get("Name"))
             if not name:
@@ -63,17 +76,13 @@ def import_vessels_from_csv_if_missing(csv_rel_path="fleet/vessels_list.csv"):
             is_retired = _to_bool(row.get("Retired"), default=False)
 
             # Exists? prefer IMO check when available
-            exists_q = Q()
-            if imo:
-                exists_q |= Q(imo=imo)
-            exists_q |= Q(name__iexact=name)
-
-            if Vessel.objects.filter(exists_q).exists():
+            name_key = name.casefold()
+            if (imo and imo in existing_imos) or (mmsi and mmsi in existing_mmsis) or name_key in existing_names:
                 skipped += 1
                 skipped_names.append(name)
                 continue
 
-            Vessel.objects.create(
+            new_objs.append(Vessel(
                 name=name,
                 vessel_type=vessel_type,
                 imo=imo,
@@ -82,9 +91,27 @@ def import_vessels_from_csv_if_missing(csv_rel_path="fleet/vessels_list.csv"):
                 owner=owner,
                 is_active=is_active,
                 is_retired=is_retired,
-            )
-            created += 1
-            created_names.append(name)
+            ))
+            # later duplicates in the same CSV are skipped, as before
+            existing_names.add(name_key)
+            if imo:
+                existing_imos.add(imo)
+            if mmsi:
+                existing_mmsis.add(mmsi)
+
+    Vessel.objects.bulk_create(new_objs, batch_size=500, ignore_conflicts=True)
+
+    # ignore_conflicts drops rows silently (e.g. a name that differs only in case the
+    # pre-filter's casefold() does not match), so report what actually landed
+    inserted = set(
+        Vessel.objects.filter(name__in=[v.name for v in new_objs]).values_list("name", flat=True)
+    ) - existing_raw_names
+    created_names = [v.name for v in new_objs if v.name in inserted]
+    created = len(created_names)
+    for v in new_objs:
+        if v.name not in inserted:
+            skipped += 1
+            skipped_names.append(v.name)
 
     return {
         "created": created,
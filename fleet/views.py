@@ -5,12 +5,14 @@ from django.http import JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.template.loader import render_to_string
 from django.views.decorators.csrf import csrf_protect
-from django.views.decorators.http import require_GET, require_POST
+from django.db.models import Count, Max
+from django.views.decorators.http import etag, require_GET, require_POST
 from django.contrib.auth.decorators import login_required, permission_required
 from django.views.decorators.http import require_POST
 
 from core.models import UserSettings
 from core.projectdb import ProjectDB
+from .http import OrjsonResponse
 from .utils import import_vessels_from_csv_if_missing
 
 
@@ -20,32 +22,41 @@ from .vessel_seq_relations import VesselSeqRelations
 from .vessel_seq_relations import PURPOSE_ID_TO_LABEL
 
 
+VESSEL_LIST_FIELDS = (
+    "id", "name", "imo", "mmsi", "call_sign", "vessel_type", "owner", "is_active", "is_retired", "notes",
+)
+VESSEL_TEXT_FIELDS = ("imo", "mmsi", "call_sign", "vessel_type", "owner", "notes")
+
+
 @login_required
 def vessel_page(request):
     return render(request, "fleet/vessels.html")
+
+
+def _vessel_list_etag(request):
+    # count + newest updated_at changes on every create/update/delete
+    agg = Vessel.objects.aggregate(n=Count("id"), mx=Max("updated_at"))
+    mx = agg["mx"].timestamp() if agg["mx"] else 0
+    return f"{agg['n']}-{mx:.6f}"
+
+
 @require_GET
 @login_required
+@etag(_vessel_list_etag)
 def api_vessel_list(request):
     q = (request.GET.get("q") or "").strip()
     qs = Vessel.objects.all()
     if q:
         qs = qs.filter(name__icontains=q)
 
-    data = []
-    for v in qs.order_by("name")[:5000]:
-        data.append({
-            "id": v.id,
-            "name": v.name,
-            "imo": v.imo or "",
-            "mmsi": v.mmsi or "",
-            "call_sign": v.call_sign or "",
-            "vessel_type": v.vessel_type or "",
-            "owner": v.owner or "",
-            "is_active": bool(v.is_active),
-            "is_retired": bool(v.is_retired),
-            "notes": v.notes or "",
-        })
-    return JsonResponse({"ok": True, "items": data})
+    # values() rows already have the response keys; patch them in place
+    data = list(qs.order_by("name").values(*VESSEL_LIST_FIELDS)[:5000])
+    for r in data:
+        for k in VESSEL_TEXT_FIELDS:
+            r[k] = r[k] or ""
+        r["is_active"] = bool(r["is_active"])
+        r["is_retired"] = bool(r["is_retired"])
+    return OrjsonResponse({"ok": True, "items": data})
 
 
 def _parse_json(request):
@@ -1,16 +1,35 @@
 import os
-import json
 import time
+import calendar
+import errno
 import fnmatch
+import queue
+import re
+import socket
+import threading
 import traceback
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
 from typing import List, Optional, Dict, Tuple
 
+import orjson
 from PySide6 import QtCore, QtWidgets
-from ftplib import FTP, FTP_TLS, error_perm
+from ftplib import FTP, FTP_TLS, error_perm, error_temp
+
+try:
+    import ssl
+except ImportError:  # same guard ftplib uses
+    ssl = None
 
 
 CONFIG_FILE = "ftp_sync_config.json"
+# monitor mode: reuse an unchanged dir's listing at most this many cycles in a row
+# (dir mtime misses files overwritten in place, so relist periodically anyway)
+DIR_CACHE_MAX_REUSE = 10
+TRANSFER_BLOCKSIZE = 1024 * 1024  # ftplib default is 8 KiB
+PROGRESS_INTERVAL_SEC = 0.1  # max ~10 progress signals/s to the GUI thread
+POOL_IDLE_CHECK_SEC = 15  # NOOP a pooled session before reuse once it sat idle this long
 
 
 # ----------------------------
@@ -37,11 +56,38 @@ class SyncJob:
     direction: str = "download"  # "download" | "upload" | "both"
     monitor: bool = False
     interval_sec: int = 60
+    max_parallel: int = 4  # concurrent FTP data connections
 
 
 # ----------------------------
 # FTP helper
 # ----------------------------
+def _ftp_time_to_epoch(s: Optional[str]) -> Optional[int]:
+    # MDTM / MLSD "modify" fact: YYYYMMDDHHMMSS[.sss], always UTC
+    s = (s or "").strip()
+    if len(s) < 14:
+        return None
+    try:
+        y, mo, d = int(s[0:4]), int(s[4:6]), int(s[6:8])
+        h, mi, se = int(s[8:10]), int(s[10:12]), int(s[12:14])
+    except ValueError:
+        return None
+    return calendar.timegm((y, mo, d, h, mi, se, 0, 0, 0))
+
+
+_MODIFY_FACT_RE = re.compile(r"modify=(\d{14})", re.IGNORECASE)
+
+
+def _compile_mask(mask: str):
+    """
+    Compiled matcher equivalent to fnmatch.fnmatch(name, mask), built once
+    per cycle instead of going through fnmatch's cache for every name.
+    """
+    # fnmatch normalizes case where the OS does (Windows)
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    return re.compile(fnmatch.translate(mask), flags).match
+
+
 class FtpClient:
     def __init__(self, profile: FtpServerProfile):
         self.profile = profile
@@ -61,6 +107,20 @@ class FtpClient:
         self.ftp = ftp
         return ftp
 
+    def ensure_connected(self) -> bool:
+        """
+        Keep the existing session if it still answers NOOP, else reconnect.
+        Returns True when a new connection (login, TLS handshake) was made.
+        """
+        if self.ftp is not None:
+            try:
+                self.ftp.voidcmd("NOOP")
+                return False
+            except Exception:
+                self.close()
+        self.connect()
+        return True
+
     def close(self):
         try:
             if self.ftp is not None:
@@ -76,6 +136,9 @@ class FtpClient:
     def cwd(self, path: str):
         self.ftp.cwd(path)
 
+    def pwd(self) -> str:
+        return self.ftp.pwd()
+
     def list_names(self) -> List[str]:
         # Prefer NLST (names only)
         try:
@@ -93,6 +156,61 @@ class FtpClient:
                     out.append(parts[-1])
             return out
 
+    def list_entries(self, match=None) -> List[Tuple[str, Dict]]:
+        """
+        Names in the current dir accepted by match (see _compile_mask; None = all)
+        with their facts: {"type": "file"|"dir"|..., "size": int|None, "mtime": epoch|None}.
+        One MLSD command; servers without MLSD fall back to NLST + SIZE, and
+        "mtime" is then left out until facts_mtime() needs it.
+        """
+        try:
+            listing = list(self.ftp.mlsd(facts=["type", "size", "modify"]))
+        except error_perm:
+            listing = None
+
+        if listing is not None:
+            out = []
+            for name, facts in listing:
+                if match is not None and not match(name):
+                    continue
+                try:
+                    size = int(facts["size"]) if "size" in facts else None
+                except ValueError:
+                    size = None
+                out.append((name, {
+                    "type": facts.get("type", "file").lower(),
+                    "size": size,
+                    "mtime": _ftp_time_to_epoch(facts.get("modify")),
+                }))
+            return out
+
+        names = [n for n in self.list_names() if n not in (".", "..")]
+        return [
+            (n, {"type": "file", "size": self.size(n)})
+            for n in names
+            if match is None or match(n)
+        ]
+
+    def dir_mtime(self, path: str) -> Optional[int]:
+        """
+        Modify time of a directory: MLST (one control-channel reply, no data
+        connection), else MDTM where the server allows it on dirs; None if neither.
+        """
+        try:
+            resp = self.ftp.sendcmd(f"MLST {path}")
+            m = _MODIFY_FACT_RE.search(resp)
+            if m:
+                return _ftp_time_to_epoch(m.group(1))
+        except Exception:
+            pass
+        return self.mdtm_epoch(path)
+
+    def facts_mtime(self, name: str, facts: Dict) -> Optional[int]:
+        # MDTM only when the listing had no mtime and a decision actually needs it
+        if "mtime" not in facts:
+            facts["mtime"] = self.mdtm_epoch(name)
+        return facts["mtime"]
+
     def size(self, filename: str) -> Optional[int]:
         try:
             return self.ftp.size(filename)
@@ -100,38 +218,241 @@ class FtpClient:
             return None
 
     def mdtm_epoch(self, filename: str) -> Optional[int]:
-        # MDTM returns YYYYMMDDHHMMSS
+        # MDTM returns YYYYMMDDHHMMSS in UTC (mktime would read it as local time)
         try:
             resp = self.ftp.sendcmd(f"MDTM {filename}")
             # resp like: '213 20260101123456'
             parts = resp.split()
             if len(parts) >= 2 and parts[0] == "213":
-                s = parts[1].strip()
-                if len(s) == 14:
-                    # convert to epoch (UTC)
-                    t = time.strptime(s, "%Y%m%d%H%M%S")
-                    return int(time.mktime(t))
+                return _ftp_time_to_epoch(parts[1])
             return None
         except Exception:
             return None
 
+    def _finish_transfer(self, conn):
+        # same shutdown as ftplib.retrbinary/storbinary: close TLS cleanly first
+        if ssl is not None and isinstance(conn, ssl.SSLSocket):
+            conn.unwrap()
+
     def download_file(self, remote_name: str, local_path: str, progress_cb=None):
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
-        with open(local_path, "wb") as f:
-            def _write(chunk: bytes):
-                f.write(chunk)
-                if progress_cb:
-                    progress_cb(len(chunk))
-            self.ftp.retrbinary(f"RETR {remote_name}", _write)
+        # one reusable buffer: no bytes object + callback per received block
+        mv = memoryview(bytearray(TRANSFER_BLOCKSIZE))
+        self.ftp.voidcmd("TYPE I")
+        with open(local_path, "wb", buffering=TRANSFER_BLOCKSIZE) as f:
+            with self.ftp.transfercmd(f"RETR {remote_name}") as conn:
+                while True:
+                    n = conn.recv_into(mv)
+                    if not n:
+                        break
+                    f.write(mv[:n])
+                    if progress_cb:
+                        progress_cb(n)
+                self._finish_transfer(conn)
+        self.ftp.voidresp()
 
     def upload_file(self, local_path: str, remote_name: str, progress_cb=None):
-        with open(local_path, "rb") as f:
-            def _read_and_callback(block):
-                if progress_cb:
-                    progress_cb(len(block))
-                return block
-            # ftplib calls callback itself; simplest is storbinary without custom iterator
-            self.ftp.storbinary(f"STOR {remote_name}", f)
+        mv = memoryview(bytearray(TRANSFER_BLOCKSIZE))
+        self.ftp.voidcmd("TYPE I")
+        with open(local_path, "rb", buffering=0) as f:
+            with self.ftp.transfercmd(f"STOR {remote_name}") as conn:
+                while True:
+                    n = f.readinto(mv)
+                    if not n:
+                        break
+                    conn.sendall(mv[:n])
+                    if progress_cb:
+                        progress_cb(n)
+                self._finish_transfer(conn)
+        self.ftp.voidresp()
+
+
+def _scan_local(local_dir: str, match) -> Dict[str, Tuple[int, int]]:
+    """
+    {name: (size, mtime)} for files in local_dir accepted by match (see _compile_mask).
+    One scandir pass; DirEntry.stat() reuses what the listing already returned
+    on Windows and costs a single stat elsewhere.
+    """
+    out = {}
+    with os.scandir(local_dir) as it:
+        for entry in it:
+            if not match(entry.name) or not entry.is_file():
+                continue
+            st = entry.stat()
+            out[entry.name] = (st.st_size, int(st.st_mtime))
+    return out
+
+
+# replies meaning "no more sessions for you right now" (too many users / per-IP limit)
+_SESSION_LIMIT_CODES = ("421", "530")
+
+
+# network-level failures a monitor job survives by reconnecting next cycle;
+# local OSErrors (permissions, disk full, failed stat) are not in here
+_CONNECTION_ERRORS = (
+    ConnectionError, TimeoutError, socket.timeout, socket.gaierror, EOFError, error_temp,
+)
+if ssl is not None:
+    _CONNECTION_ERRORS += (ssl.SSLError,)
+# plain OSErrors that still mean "the network went away"
+_NETWORK_ERRNOS = frozenset(
+    getattr(errno, n) for n in ("ENETDOWN", "ENETUNREACH", "ENETRESET", "EHOSTDOWN", "EHOSTUNREACH")
+    if hasattr(errno, n)
+)
+
+
+def _is_connection_error(e: BaseException) -> bool:
+    if isinstance(e, _CONNECTION_ERRORS):
+        return True
+    return isinstance(e, OSError) and e.filename is None and e.errno in _NETWORK_ERRNOS
+
+
+class FtpConnectionPool:
+    """
+    Idle FtpClient connections (already in remote_dir) shared by transfer threads.
+    The worker's own control connection is lent as the first session for each
+    batch (see lend()); extra sessions are opened lazily, stay open across
+    monitor cycles and are only closed by close(). When the server refuses
+    another login (421/530) the pool stops growing and callers wait for an
+    idle session instead.
+    """
+    def __init__(self, profile: FtpServerProfile, remote_dir: str):
+        self.profile = profile
+        self.remote_dir = remote_dir
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+        self._open = 0  # sessions owned by the pool or lent to it
+        self._limit = None  # set once the server refuses a login
+
+    @contextmanager
+    def lend(self, primary: FtpClient):
+        """
+        Make primary (already in remote_dir) usable by client() for the
+        duration of the block; it is taken back out afterwards.
+        """
+        with self._lock:
+            self._open += 1
+        self._idle.put((primary, time.monotonic()))
+        try:
+            yield
+        finally:
+            # no transfers are running any more: every live session is idle
+            keep = []
+            while True:
+                try:
+                    item = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if item[0] is not primary:
+                    keep.append(item)
+            for item in keep:
+                self._idle.put(item)
+            with self._lock:
+                # primary was either found above or closed (and uncounted) by client()
+                if primary.ftp is not None:
+                    self._open -= 1
+
+    def _open_client(self) -> Optional[FtpClient]:
+        """New session in remote_dir, or None when the server's session limit is hit."""
+        with self._lock:
+            if self._limit is not None and self._open >= self._limit:
+                return None
+            self._open += 1
+        c = FtpClient(self.profile)
+        try:
+            c.connect()
+            c.cwd(self.remote_dir)
+        except (error_temp, error_perm) as e:
+            c.close()
+            with self._lock:
+                self._open -= 1
+                if not str(e).startswith(_SESSION_LIMIT_CODES) or self._open == 0:
+                    raise
+                self._limit = self._open
+            return None
+        except Exception:
+            c.close()
+            with self._lock:
+                self._open -= 1
+            raise
+        return c
+
+    @property
+    def limit(self) -> Optional[int]:
+        """Most sessions the server accepted, or None if it never refused one."""
+        return self._limit
+
+    def _discard(self, c: FtpClient):
+        c.close()
+        with self._lock:
+            self._open -= 1
+
+    def _get(self) -> FtpClient:
+        try:
+            c, idle_since = self._idle.get_nowait()
+        except queue.Empty:
+            while True:
+                c = self._open_client()
+                if c is not None:
+                    return c
+                # at the server's limit: wait for a session, re-checking in case
+                # the ones in use get discarded and free a slot
+                try:
+                    c, idle_since = self._idle.get(timeout=1.0)
+                    break
+                except queue.Empty:
+                    pass
+        # a session parked since the last monitor cycle may have timed out server-side
+        if time.monotonic() - idle_since >= POOL_IDLE_CHECK_SEC:
+            try:
+                if c.ensure_connected():
+                    c.cwd(self.remote_dir)
+            except Exception:
+                self._discard(c)
+                raise
+        return c
+
+    @contextmanager
+    def client(self):
+        c = self._get()
+        try:
+            yield c
+        except Exception:
+            # connection state unknown after a failed transfer, don't reuse it
+            self._discard(c)
+            raise
+        self._idle.put((c, time.monotonic()))
+
+    def close(self):
+        while True:
+            try:
+                c, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(c)
+
+
+class _ProgressCounter:
+    """
+    Thread-safe byte total shared by parallel transfers.
+    add() returns the new total only when a progress signal is due
+    (every PROGRESS_INTERVAL_SEC, and once at completion), else None.
+    """
+    def __init__(self, total: int):
+        self._lock = threading.Lock()
+        self.total = total
+        self.value = 0
+        self._last_emit = 0.0
+
+    def add(self, n: int) -> Optional[int]:
+        with self._lock:
+            self.value += n
+            now = time.monotonic()
+            finished = 0 < self.total <= self.value
+            if now - self._last_emit < PROGRESS_INTERVAL_SEC and not finished:
+                return None
+            self._last_emit = now
+            return self.value
 
 
 # ----------------------------
@@ -139,47 +460,64 @@ class FtpClient:
 # ----------------------------
 class SyncWorker(QtCore.QObject):
     log = QtCore.Signal(str)
-    status = QtCore.Signal(str)
-    progress = QtCore.Signal(int, int, str)  # done_bytes, total_bytes, label
+    # first arg is the job epoch, so the window can drop signals from a stopped run
+    status = QtCore.Signal(int, str)
+    progress = QtCore.Signal(int, int, int, str)  # epoch, done_bytes, total_bytes, label
     finished = QtCore.Signal()
     error = QtCore.Signal(str)
 
-    def __init__(self, profile: FtpServerProfile, job: SyncJob):
+    def __init__(self, profile: FtpServerProfile, job: SyncJob, epoch: int = 0):
         super().__init__()
         self.profile = profile
         self.job = job
-        self._stop = False
+        self.epoch = epoch
+        self._stop_event = threading.Event()
+        self._pool = FtpConnectionPool(profile, job.remote_dir)
+        # (dir_mtime, remote_files, reuse_count) from the previous monitor cycle
+        self._listing_cache = None
+        # job.remote_dir as an absolute path (it may be relative to the login dir)
+        self._remote_abs = None
 
     @QtCore.Slot()
     def run(self):
         ftp_client = FtpClient(self.profile)
         try:
-            self.status.emit("Connecting...")
+            self.status.emit(self.epoch, "Connecting...")
             ftp_client.connect()
             self.log.emit(f"Connected to {self.profile.host}:{self.profile.port} as {self.profile.user}")
 
-            while not self._stop:
-                self._run_one_cycle(ftp_client)
+            while not self._stop_event.is_set():
+                try:
+                    if ftp_client.ensure_connected():
+                        self.log.emit(f"Reconnected to {self.profile.host}:{self.profile.port}")
+                    self._run_one_cycle(ftp_client)
+                except Exception as e:
+                    # dropped/timed-out session: a monitor job retries next cycle
+                    if not self.job.monitor or not _is_connection_error(e):
+                        raise
+                    self.log.emit(f"Connection error: {e}. Will reconnect next cycle.")
+                    ftp_client.close()
 
                 if not self.job.monitor:
                     break
 
-                self.status.emit(f"Waiting {self.job.interval_sec}s (monitoring)...")
-                for _ in range(self.job.interval_sec):
-                    if self._stop:
-                        break
-                    time.sleep(1)
+                self.status.emit(self.epoch, f"Waiting {self.job.interval_sec}s (monitoring)...")
+                # returns True as soon as stop() is called
+                if self._stop_event.wait(self.job.interval_sec):
+                    break
 
-            self.status.emit("Stopped.")
+            self.status.emit(self.epoch, "Stopped.")
         except Exception:
             msg = traceback.format_exc()
             self.error.emit(msg)
         finally:
+            # pooled sessions live as long as the job, not just one monitor cycle
+            self._pool.close()
             ftp_client.close()
             self.finished.emit()
 
     def stop(self):
-        self._stop = True
+        self._stop_event.set()
 
     def _run_one_cycle(self, ftp_client: FtpClient):
         job = self.job
@@ -190,152 +528,239 @@ class SyncWorker(QtCore.QObject):
             self.log.emit("Local dir is empty. Skipping.")
             return
 
-        self.status.emit("Listing remote...")
-        ftp_client.cwd(job.remote_dir)
-        names = ftp_client.list_names()
-
-        # Filter by mask and exclude '.' '..'
         mask = job.mask.strip() or "*.*"
-        remote_files = [n for n in names if n not in (".", "..") and fnmatch.fnmatch(n, mask)]
+        match = _compile_mask(mask)
 
-        self.log.emit(f"Remote files matched ({mask}): {len(remote_files)}")
-
-        # Decide transfers
+        # Local scan (disk) runs in the background while the remote listing (network) is fetched
         os.makedirs(job.local_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            local_fut = ex.submit(_scan_local, job.local_dir, match)
+
+            self.status.emit(self.epoch, "Listing remote...")
+            ftp_client.cwd(job.remote_dir)
+
+            # Filter by mask; only plain files (MLSD also reports dirs, cdir, pdir)
+            remote_files = self._remote_listing(ftp_client, match)
+            self.log.emit(f"Remote files matched ({mask}): {len(remote_files)}")
+
+            # Decide transfers
+            local_files = local_fut.result()
 
         if job.direction in ("download", "both"):
-            self._do_downloads(ftp_client, remote_files)
+            self._do_downloads(ftp_client, remote_files, local_files)
 
-        if self._stop:
+        if self._stop_event.is_set():
             return
 
         if job.direction in ("upload", "both"):
-            self._do_uploads(ftp_client, mask)
+            self._do_uploads(ftp_client, remote_files, local_files)
 
-        self.status.emit("Cycle complete.")
+        self.status.emit(self.epoch, "Cycle complete.")
 
-    def _do_downloads(self, ftp_client: FtpClient, remote_files: List[str]):
+    def _remote_listing(self, ftp_client: FtpClient, match) -> List[Tuple[str, Dict]]:
+        job = self.job
+        # Only download-only monitor jobs cache: uploads change the remote dir themselves
+        use_cache = job.monitor and job.direction == "download"
+        dir_m = None
+        if use_cache:
+            # we are already inside remote_dir, so a relative job.remote_dir
+            # would be resolved against itself; ask the server once instead
+            if self._remote_abs is None:
+                self._remote_abs = ftp_client.pwd()
+            dir_m = ftp_client.dir_mtime(self._remote_abs)
+
+        cached = self._listing_cache
+        if (
+            dir_m is not None
+            and cached is not None
+            and cached[0] == dir_m
+            and cached[2] < DIR_CACHE_MAX_REUSE
+        ):
+            self._listing_cache = (dir_m, cached[1], cached[2] + 1)
+            self.log.emit("Remote dir unchanged, reusing previous listing.")
+            return cached[1]
+
+        remote_files = [(n, f) for n, f in ftp_client.list_entries(match) if f["type"] == "file"]
+        self._listing_cache = (dir_m, remote_files, 0) if dir_m is not None else None
+        return remote_files
+
+    def _do_downloads(
+        self,
+        ftp_client: FtpClient,
+        remote_files: List[Tuple[str, Dict]],
+        local_files: Dict[str, Tuple[int, int]],
+    ):
         job = self.job
-        self.status.emit("Checking downloads...")
+        self.status.emit(self.epoch, "Checking downloads...")
         to_download = []
 
-        for name in remote_files:
-            remote_size = ftp_client.size(name)
-            remote_m = ftp_client.mdtm_epoch(name)
+        for name, facts in remote_files:
+            remote_size = facts["size"]
             local_path = os.path.join(job.local_dir, name)
 
-            if not os.path.exists(local_path):
-                to_download.append((name, local_path, remote_size))
+            local = local_files.get(name)
+            if local is None:
+                to_download.append((name, local_path, remote_size, facts))
                 continue
 
-            # Compare size or mtime if available
-            local_size = os.path.getsize(local_path)
-            local_m = int(os.path.getmtime(local_path))
+            # Compare size first; mtime only decides when sizes match
+            local_size, local_m = local
 
             if remote_size is not None and local_size != remote_size:
-                to_download.append((name, local_path, remote_size))
-            elif remote_m is not None and remote_m > local_m + 1:
-                to_download.append((name, local_path, remote_size))
+                to_download.append((name, local_path, remote_size, facts))
+                continue
+
+            remote_m = ftp_client.facts_mtime(name, facts)
+            if remote_m is not None and remote_m > local_m + 1:
+                to_download.append((name, local_path, remote_size, facts))
 
         self.log.emit(f"Downloads needed: {len(to_download)}")
-        for name, local_path, remote_size in to_download:
-            if self._stop:
+        total = sum(sz or 0 for _, _, sz, _ in to_download)
+        counter = _ProgressCounter(total)
+        # bytes are summed over all parallel transfers, so label the batch, not a file
+        label = f"DL {len(to_download)} files"
+
+        def _download_one(name, local_path, remote_size, facts):
+            if self._stop_event.is_set():
                 return
-            label = f"DL {name}"
-            self.status.emit(f"Downloading {name}...")
-            done = 0
-            total = remote_size or 0
+            self.status.emit(self.epoch, f"Downloading {name}...")
 
             def cb(nbytes):
-                nonlocal done
-                done += nbytes
                 # if total unknown, just show done
-                self.progress.emit(done, total, label)
-
-            ftp_client.download_file(name, local_path, progress_cb=cb)
-            # Set local mtime to remote mdtm if we have it
-            rm = ftp_client.mdtm_epoch(name)
-            if rm is not None:
+                done = counter.add(nbytes)
+                if done is not None:
+                    self.progress.emit(self.epoch, done, total, label)
+
+            with self._pool.client() as c:
+                c.download_file(name, local_path, progress_cb=cb)
+                remote_m = c.facts_mtime(name, facts)
+            # Set local mtime to the remote mtime from the listing if we have it
+            if remote_m is not None:
                 try:
-                    os.utime(local_path, (rm, rm))
+                    os.utime(local_path, (remote_m, remote_m))
                 except Exception:
                     pass
+            # keep the scan current so the upload pass doesn't send the file back
+            st = os.stat(local_path)
+            local_files[name] = (st.st_size, int(st.st_mtime))
             self.log.emit(f"Downloaded: {name} -> {local_path}")
 
-    def _do_uploads(self, ftp_client: FtpClient, mask: str):
-        job = self.job
-        self.status.emit("Checking uploads...")
+        self._run_parallel(ftp_client, _download_one, to_download)
 
-        # Remote list again for existence checks
-        try:
-            remote_names = set(ftp_client.list_names())
-        except Exception:
-            remote_names = set()
+    def _do_uploads(
+        self,
+        ftp_client: FtpClient,
+        remote_files: List[Tuple[str, Dict]],
+        local_files: Dict[str, Tuple[int, int]],
+    ):
+        job = self.job
+        self.status.emit(self.epoch, "Checking uploads...")
 
-        local_files = [
-            f for f in os.listdir(job.local_dir)
-            if os.path.isfile(os.path.join(job.local_dir, f)) and fnmatch.fnmatch(f, mask)
-        ]
+        # Existence checks use the listing taken at the start of the cycle;
+        # downloads never change the remote side, so it is still current.
+        remote_facts = dict(remote_files)
 
         to_upload = []
-        for f in local_files:
+        for f, (local_size, local_m) in local_files.items():
             local_path = os.path.join(job.local_dir, f)
-            local_size = os.path.getsize(local_path)
-            local_m = int(os.path.getmtime(local_path))
 
-            if f not in remote_names:
+            facts = remote_facts.get(f)
+            if facts is None:
                 to_upload.append((f, local_path, local_size))
                 continue
 
-            remote_size = ftp_client.size(f)
-            remote_m = ftp_client.mdtm_epoch(f)
-
+            remote_size = facts["size"]
             if remote_size is not None and remote_size != local_size:
                 to_upload.append((f, local_path, local_size))
-            elif remote_m is not None and local_m > remote_m + 1:
+                continue
+
+            remote_m = ftp_client.facts_mtime(f, facts)
+            if remote_m is not None and local_m > remote_m + 1:
                 to_upload.append((f, local_path, local_size))
 
         self.log.emit(f"Uploads needed: {len(to_upload)}")
-        for name, local_path, local_size in to_upload:
-            if self._stop:
+        total = sum(sz for _, _, sz in to_upload)
+        counter = _ProgressCounter(total)
+        label = f"UL {len(to_upload)} files"
+
+        def _upload_one(name, local_path, local_size):
+            if self._stop_event.is_set():
                 return
-            label = f"UL {name}"
-            self.status.emit(f"Uploading {name}...")
-            done = 0
-            total = local_size
+            self.status.emit(self.epoch, f"Uploading {name}...")
 
             def cb(nbytes):
-                nonlocal done
-                done += nbytes
-                self.progress.emit(done, total, label)
-
-            # (ftplib storbinary doesn't give per-chunk callback easily without custom file wrapper;
-            # this cb might not be called. Keep it for future extension.)
-            ftp_client.upload_file(local_path, name, progress_cb=None)
-            self.progress.emit(total, total, label)
+                done = counter.add(nbytes)
+                if done is not None:
+                    self.progress.emit(self.epoch, done, total, label)
+
+            with self._pool.client() as c:
+                c.upload_file(local_path, name, progress_cb=cb)
             self.log.emit(f"Uploaded: {local_path} -> {name}")
 
+        self._run_parallel(ftp_client, _upload_one, to_upload)
+
+    def _run_parallel(self, ftp_client: FtpClient, fn, items):
+        if not items:
+            return
+        workers = max(1, min(int(self.job.max_parallel or 1), len(items)))
+        limit = self._pool.limit
+        if limit is not None and limit < workers:
+            # no point in threads that would only queue for a session
+            self.log.emit(f"Server allows {limit} session(s); transferring {limit} at a time.")
+            workers = limit
+        # the control connection sits idle during transfers: it is the first session
+        with self._pool.lend(ftp_client), ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(fn, *it) for it in items]
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception:
+                    for f in futures:
+                        f.cancel()
+                    raise
+
 
 # ----------------------------
 # Config persistence
 # ----------------------------
+# bytes last read from / written to CONFIG_FILE; unchanged saves are skipped
+_saved_payload: Optional[bytes] = None
+
+
+def _to_plain(obj) -> dict:
+    # profiles/jobs hold only primitives: a shallow dict equals asdict() without its deepcopy
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
 def load_config() -> Tuple[List[FtpServerProfile], List[SyncJob]]:
+    global _saved_payload
     if not os.path.exists(CONFIG_FILE):
         return [], []
-    with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(CONFIG_FILE, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw)
+    _saved_payload = raw
     servers = [FtpServerProfile(**x) for x in data.get("servers", [])]
     jobs = [SyncJob(**x) for x in data.get("jobs", [])]
     return servers, jobs
 
 
 def save_config(servers: List[FtpServerProfile], jobs: List[SyncJob]) -> None:
+    global _saved_payload
     data = {
-        "servers": [asdict(s) for s in servers],
-        "jobs": [asdict(j) for j in jobs],
+        "servers": [_to_plain(s) for s in servers],
+        "jobs": [_to_plain(j) for j in jobs],
     }
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    if payload == _saved_payload:
+        return
+
+    # write a temp file and swap it in, so a crash never leaves a half-written config
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, CONFIG_FILE)
+    _saved_payload = payload
 
 
 # ----------------------------
@@ -432,6 +857,10 @@ class JobDialog(QtWidgets.QDialog):
         self.interval.setRange(5, 999999)
         self.interval.setValue(60)
 
+        self.max_parallel = QtWidgets.QSpinBox()
+        self.max_parallel.setRange(1, 16)
+        self.max_parallel.setValue(4)
+
         self.local_browse.clicked.connect(self._pick_local)
 
         row_local = QtWidgets.QHBoxLayout()
@@ -446,6 +875,7 @@ class JobDialog(QtWidgets.QDialog):
         form.addRow("Direction:", self.direction)
         form.addRow("", self.monitor)
         form.addRow("Interval (s):", self.interval)
+        form.addRow("Parallel transfers:", self.max_parallel)
 
         btns = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok |
@@ -468,6 +898,7 @@ class JobDialog(QtWidgets.QDialog):
             self.direction.setCurrentText(job.direction)
             self.monitor.setChecked(job.monitor)
             self.interval.setValue(job.interval_sec)
+            self.max_parallel.setValue(job.max_parallel)
 
     def _pick_local(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Select local folder", self.local_dir.text() or os.getcwd())
@@ -483,6 +914,7 @@ class JobDialog(QtWidgets.QDialog):
             direction=self.direction.currentText(),
             monitor=self.monitor.isChecked(),
             interval_sec=int(self.interval.value()),
+            max_parallel=int(self.max_parallel.value()),
         )
 
 
@@ -563,7 +995,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.log_box = QtWidgets.QPlainTextEdit()
         self.log_box.setReadOnly(True)
-        self.log_box.setMaximumBlockCount(5000)
+        self.log_box.setMaximumBlockCount(2000)
+
+        # log lines are buffered and appended in one go at most every 200 ms
+        self._log_buffer: List[str] = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(200)
+        self._log_timer.timeout.connect(self._flush_log)
 
         right = QtWidgets.QVBoxLayout()
         right.addWidget(QtWidgets.QLabel("Sync Jobs"))
@@ -583,9 +1022,12 @@ class MainWindow(QtWidgets.QMainWindow):
         splitter.setStretchFactor(1, 1)
         self.setCentralWidget(splitter)
 
-        # Worker thread refs
-        self._thread = None
+        # Worker runs on a pool thread; the worker object itself stays on the GUI
+        # thread, so its signals reach the slots below as queued calls.
+        self.pool = QtCore.QThreadPool.globalInstance()
         self._worker = None
+        # bumped on run and on stop; status/progress tagged with an older epoch are ignored
+        self._job_epoch = 0
 
     # ---------- helpers ----------
     def closeEvent(self, event):
@@ -595,18 +1037,35 @@ class MainWindow(QtWidgets.QMainWindow):
         event.accept()
 
     def _refresh_servers(self):
-        self.server_list.clear()
-        for s in self.servers:
-            self.server_list.addItem(s.name)
+        # Every edit of self.servers ends up here, so keep the name index in step.
+        self._servers_by_name = {s.name: s for s in self.servers}
+        self.server_list.setUpdatesEnabled(False)
+        self.server_list.blockSignals(True)
+        try:
+            self.server_list.clear()
+            self.server_list.addItems([s.name for s in self.servers])
+        finally:
+            self.server_list.blockSignals(False)
+            self.server_list.setUpdatesEnabled(True)
 
     def _refresh_jobs(self):
-        self.job_table.setRowCount(0)
-        for j in self.jobs:
-            r = self.job_table.rowCount()
-            self.job_table.insertRow(r)
-            vals = [j.server_name, j.remote_dir, j.mask, j.local_dir, j.direction, "Yes" if j.monitor else "No"]
-            for c, v in enumerate(vals):
-                self.job_table.setItem(r, c, QtWidgets.QTableWidgetItem(str(v)))
+        # size once and fill in place; no repaint/relayout per inserted row
+        t = self.job_table
+        sorting = t.isSortingEnabled()
+        t.setUpdatesEnabled(False)
+        t.blockSignals(True)
+        t.setSortingEnabled(False)
+        try:
+            t.clearContents()
+            t.setRowCount(len(self.jobs))
+            for r, j in enumerate(self.jobs):
+                vals = [j.server_name, j.remote_dir, j.mask, j.local_dir, j.direction, "Yes" if j.monitor else "No"]
+                for c, v in enumerate(vals):
+                    t.setItem(r, c, QtWidgets.QTableWidgetItem(str(v)))
+        finally:
+            t.setSortingEnabled(sorting)
+            t.blockSignals(False)
+            t.setUpdatesEnabled(True)
 
     def _selected_server_index(self) -> int:
         row = self.server_list.currentRow()
@@ -619,13 +1078,19 @@ class MainWindow(QtWidgets.QMainWindow):
         return rows[0].row()
 
     def _find_server(self, name: str) -> Optional[FtpServerProfile]:
-        for s in self.servers:
-            if s.name == name:
-                return s
-        return None
+        return self._servers_by_name.get(name)
 
     def log(self, msg: str):
-        self.log_box.appendPlainText(msg)
+        self._log_buffer.append(msg)
+        # not restarted while pending: a steady stream still flushes every 200 ms
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        self.log_box.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
 
     # ---------- server actions ----------
     def add_server(self):
@@ -753,13 +1218,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.status_lbl.setText("Starting...")
         self.log(f"--- RUN JOB: {job.server_name} {job.remote_dir} mask={job.mask} dir={job.direction} monitor={job.monitor} ---")
 
-        self._thread = QtCore.QThread(self)
-        self._worker = SyncWorker(prof, job)
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
+        self._job_epoch += 1
+        self._worker = SyncWorker(prof, job, self._job_epoch)
         self._worker.log.connect(self.log)
-        self._worker.status.connect(self.status_lbl.setText)
+        self._worker.status.connect(self._on_status)
         self._worker.progress.connect(self._on_progress)
         self._worker.error.connect(self._on_error)
         self._worker.finished.connect(self._on_finished)
@@ -767,15 +1229,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_stop.setEnabled(True)
         self.btn_run_job.setEnabled(False)
 
-        self._thread.start()
+        self.pool.start(self._worker.run)
 
     def stop_job(self):
         if self._worker:
             self.log("Stopping...")
+            self._job_epoch += 1
             self._worker.stop()
             self.btn_stop.setEnabled(False)
 
-    def _on_progress(self, done: int, total: int, label: str):
+    def _on_status(self, epoch: int, text: str):
+        if epoch != self._job_epoch:
+            return
+        self.status_lbl.setText(text)
+
+    def _on_progress(self, epoch: int, done: int, total: int, label: str):
+        if epoch != self._job_epoch:
+            return
         if total and total > 0:
             pct = int((done / total) * 100)
             pct = max(0, min(100, pct))
@@ -795,10 +1265,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.status_lbl.setText("Idle.")
         self.progress_bar.setValue(0)
 
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait(2000)
-        self._thread = None
         self._worker = None
 
         self.btn_stop.setEnabled(False)
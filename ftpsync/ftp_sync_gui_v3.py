@@ -1,24 +1,34 @@
 import os
+import re
+import socket
 import json
 import time
 import fnmatch
 import traceback
-import calendar
 import threading
 import uuid
 import shutil
-from dataclasses import fields, dataclass, asdict
-from datetime import datetime
-from typing import List, Optional, Dict, Tuple
+import contextlib
+from stat import S_ISDIR
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import fields, dataclass
+from datetime import date, datetime
+from typing import Callable, List, Optional, Dict, Tuple
 
 from PySide6 import QtCore, QtWidgets, QtGui, QtSvg
-from ftplib import FTP, FTP_TLS
+from ftplib import FTP, FTP_TLS, error_perm, error_reply, parse150
 
 try:
     import paramiko
 except Exception:
     paramiko = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ------------------------------------------------------------
 # Paths
@@ -27,6 +37,22 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_FILE = os.path.join(BASE_DIR, "ftp_sync_config.json")
 FA_DIR = os.path.join(BASE_DIR, "icons", "svgs-full", "solid")
 
+# MDTM/SIZE pairs written per pipelined batch on the FTP control channel
+MDTM_PIPELINE_CHUNK = 64
+# Seconds a remote directory listing is reused by the same client
+LIST_CACHE_TTL_SEC = 30.0
+# Bytes per read/write on the transfer channel
+TRANSFER_BLOCKSIZE = 1024 * 1024
+# Threads scanning local directories concurrently during a sync cycle
+LOCAL_SCAN_WORKERS = 8
+# SSH channel window/packet sizes (kernel socket buffers are per profile, 0 = OS autotuning)
+SFTP_WINDOW_SIZE = 4 << 20
+SFTP_MAX_PACKET_SIZE = 256 << 10
+# Minimum gap between per-file progress signals (~30 Hz); completion always reports
+PROGRESS_EMIT_INTERVAL_NS = 33_000_000
+# Idle connections are kept this long for reuse by later job runs
+CLIENT_MAX_IDLE_SEC = 120.0
+
 
 # ------------------------------------------------------------
 # Icons + styling helpers
@@ -311,6 +337,8 @@ class ServerProfile:
     passive: bool = True
     timeout: int = 30
     tz_offset_min: int = 0
+    parallel_transfers: int = 2
+    socket_buffer_kb: int = 0
 
 
 @dataclass
@@ -349,6 +377,8 @@ class RemoteEntry:
     is_dir: bool
     size: Optional[int] = None
     mtime: Optional[int] = None
+    # seconds covered by mtime: 1 for MDTM/MLSD, 60 or 86400 for LIST stamps
+    mtime_precision: int = 1
 
 
 # ------------------------------------------------------------
@@ -366,11 +396,11 @@ def load_config():
         return [], [], default_groups, 2
 
     try:
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+        with open(CONFIG_FILE, "rb") as f:
             raw = f.read().strip()
         if not raw:
             raise ValueError("Config is empty")
-        data = json.loads(raw)
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         bad_path = CONFIG_FILE + f".broken_{ts}"
@@ -399,24 +429,154 @@ def load_config():
 
 
 
+def _to_plain(obj) -> dict:
+    # profiles/groups/jobs hold only primitives: a shallow dict equals asdict() without its deepcopy
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+
 def save_config(servers: List[ServerProfile], jobs: List[SyncJob], groups: List[JobGroup], concurrency: int) -> None:
     data = {
-        "servers": [asdict(s) for s in servers],
-        "groups": [asdict(g) for g in groups],
-        "jobs": [asdict(j) for j in jobs],
+        "servers": [_to_plain(s) for s in servers],
+        "groups": [_to_plain(g) for g in groups],
+        "jobs": [_to_plain(j) for j in jobs],
         "concurrency": int(concurrency),
     }
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    with open(CONFIG_FILE, "wb") as f:
+        f.write(payload)
 
 
 # ------------------------------------------------------------
 # Helpers
 # ------------------------------------------------------------
 def _join_remote(base: str, rel: str) -> str:
+    return _remote_prefix(base) + rel.lstrip("/")
+
+
+
+def _remote_prefix(base: str) -> str:
+    # "/data" -> "/data/", so callers joining many names can use plain concatenation
     base = base or "/"
-    rel = rel.lstrip("/")
-    return base + rel if base.endswith("/") else base + "/" + rel
+    return base if base.endswith("/") else base + "/"
+
+
+
+_MASK_MAGIC_RE = re.compile(r"[*?\[]")
+_EXT_MASK_RE = re.compile(r"\*(\.[A-Za-z0-9]+)")
+_FINAL_REPLY_RE = re.compile(r"^\d{3} ")
+_LIST_UNIX_RE = re.compile(r"^([\-dl])\S+\s+\d+\s+\S+\s+\S+\s+(\d+)\s+(\w{3}\s+\d+\s+[\d:]+)\s+(.+)$")
+_LIST_DOS_RE = re.compile(r"^(\d{2}-\d{2}-\d{2,4})\s+(\d{1,2}:\d{2}[AP]M)\s+(<DIR>|\d+)\s+(.+)$", re.IGNORECASE)
+
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# LIST month names are always English; time.strptime("%b") follows the process
+# locale, which Qt sets from the environment on Unix.
+_MONTHS = {m: i for i, m in enumerate(
+    ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"), 1)}
+
+
+def _utc_epoch(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> int:
+    return (date(year, month, day).toordinal() - _EPOCH_ORDINAL) * 86400 + hour * 3600 + minute * 60
+
+
+def parse_list_line(line: str, tz_offset_min: int = 0) -> Optional[Tuple[Optional[bool], Optional[int], Optional[int], str, int]]:
+    """Parse one Unix or DOS style LIST line into (is_dir, size, mtime, name, precision).
+
+    Returns None when the line matches neither format. is_dir is None for
+    symlinks, whose target type is unknown without a probe. precision is the
+    span mtime was truncated to: 60 for "Mon DD HH:MM" and DOS stamps, 86400
+    for "Mon DD YYYY".
+    """
+    m = _LIST_UNIX_RE.match(line)
+    if m:
+        kind, size, stamp, name = m.groups()
+        if kind == "l":
+            name = name.split(" -> ", 1)[0]
+        mon, day, year_or_time = stamp.split()
+        try:
+            month = _MONTHS[mon.lower()]
+            precision = 60
+            if ":" in year_or_time:
+                hh, mm = year_or_time.split(":")
+                year = time.gmtime().tm_year
+                mtime = _utc_epoch(year, month, int(day), int(hh), int(mm))
+                # Recent entries omit the year; a stamp in the future belongs to last year.
+                if mtime > time.time() + 86400:
+                    mtime = _utc_epoch(year - 1, month, int(day), int(hh), int(mm))
+            else:
+                mtime = _utc_epoch(int(year_or_time), month, int(day))
+                precision = 86400
+            mtime += int(tz_offset_min) * 60
+        except (KeyError, ValueError):
+            mtime, precision = None, 1
+        is_dir = None if kind == "l" else kind == "d"
+        return is_dir, (None if is_dir else int(size)), mtime, name, precision
+
+    m = _LIST_DOS_RE.match(line)
+    if m:
+        date_s, time_s, size, name = m.groups()
+        try:
+            mo, dd, yy = (int(x) for x in date_s.split("-"))
+            if len(date_s) != 10:
+                yy += 1900 if yy >= 69 else 2000  # same pivot as strptime's %y
+            hh, mm = int(time_s[:-5]), int(time_s[-4:-2])
+            hh = hh % 12 + (12 if time_s[-2:].upper() == "PM" else 0)
+            mtime = _utc_epoch(yy, mo, dd, hh, mm) + int(tz_offset_min) * 60
+        except ValueError:
+            mtime = None
+        if size.upper() == "<DIR>":
+            return True, None, mtime, name, 60
+        return False, int(size), mtime, name, 60
+    return None
+
+
+def _ftp_time_to_epoch(s: Optional[str]) -> Optional[int]:
+    # MDTM / MLSD "modify" value: YYYYMMDDHHMMSS[.sss], UTC. Sliced by hand;
+    # time.strptime is far slower and runs once per listed entry. Day ordinals
+    # are about twice as fast as calendar.timegm (and datetime.timestamp()).
+    s = (s or "").strip()
+    if len(s) < 14:
+        return None
+    try:
+        days = date(int(s[0:4]), int(s[4:6]), int(s[6:8])).toordinal() - _EPOCH_ORDINAL
+        return days * 86400 + int(s[8:10]) * 3600 + int(s[10:12]) * 60 + int(s[12:14])
+    except ValueError:
+        return None
+
+
+
+def split_mask(mask: str) -> Tuple[str, str]:
+    # Leading wildcard-free directories of a mask become a walk root:
+    # "raw/2024/*.sgy" -> ("raw/2024", "*.sgy"). A mask with wildcard
+    # directories is left whole.
+    parts = [p for p in mask.split("/") if p]
+    if len(parts) < 2 or any(_MASK_MAGIC_RE.search(p) for p in parts[:-1]):
+        return "", mask
+    return "/".join(parts[:-1]), parts[-1]
+
+
+
+def compile_mask(mask: str) -> Optional[Callable[[str], object]]:
+    # Same result as fnmatch.fnmatch(name, mask), compiled once per cycle.
+    # fnmatch folds case where the OS does (Windows). None means "match all";
+    # only "*" qualifies, since "*.*" still requires a dot in the name.
+    if mask == "*":
+        return None
+    fold = os.path.normcase("A") == "a"
+    m = _EXT_MASK_RE.fullmatch(mask)
+    if m:
+        # "*.ext" is a plain suffix test; no regex engine needed.
+        suffix = m.group(1)
+        if fold:
+            suffix = suffix.lower()
+            return lambda name: name.lower().endswith(suffix)
+        return lambda name: name.endswith(suffix)
+    return re.compile(fnmatch.translate(mask), re.IGNORECASE if fold else 0).match
 
 
 
@@ -473,29 +633,190 @@ def ensure_default_group(groups: List[JobGroup]) -> None:
 # Remote client abstraction
 # ------------------------------------------------------------
 class RemoteClientBase:
+    cache_ttl: float = LIST_CACHE_TTL_SEC
+
     def connect(self): ...
     def close(self): ...
-    def list_dir(self, path: str) -> List[RemoteEntry]: ...
-    def download(self, remote_path: str, local_path: str, progress_cb=None): ...
-    def upload(self, local_path: str, remote_path: str, progress_cb=None): ...
+    def _list_dir(self, path: str) -> List[RemoteEntry]: ...
+
+    def list_dir(self, path: str) -> List[RemoteEntry]:
+        path = path or "/"
+        hit = self._ldc.get(path)
+        if hit is not None and time.monotonic() - hit[0] < self.cache_ttl:
+            return hit[1]
+        entries = self._list_dir(path)
+        self._ldc[path] = (time.monotonic(), entries)
+        return entries
+
+    def is_alive(self) -> bool:
+        return False
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        if path is None:
+            self._ldc.clear()
+        else:
+            self._ldc.pop(path or "/", None)
+
+    def download(self, remote_path: str, local_path: str, progress_cb=None, known_entry: Optional[RemoteEntry] = None): ...
+    def upload(self, local_path: str, remote_path: str, progress_cb=None, size: Optional[int] = None): ...
     def ensure_dir(self, path: str): ...
     def stat(self, path: str) -> Optional[RemoteEntry]: ...
 
+    def _make_dirs(self, path: str, exists, mkdir) -> None:
+        parts = [p for p in path.split("/") if p]
+        # Probe from the leaf upwards: usually the whole path or all but its
+        # last segment exists, so this costs one or two round trips, not one per level.
+        start = 0
+        for i in range(len(parts), 0, -1):
+            if exists("/" + "/".join(parts[:i])):
+                start = i
+                break
+        for i in range(start, len(parts)):
+            try:
+                mkdir("/" + "/".join(parts[:i + 1]))
+                self.invalidate("/" + "/".join(parts[:i]))
+            except Exception:
+                pass
+
+
+def _set_nodelay(sock) -> None:
+    # TCP_NODELAY keeps small command writes from waiting on Nagle.
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass
+
+
+def _set_buffers(sock, bufsize: int) -> None:
+    # Must happen before connect()/listen(): the window scale is fixed in the handshake.
+    # A fixed size also switches off the OS autotuning, so only do it when configured.
+    if bufsize <= 0:
+        return
+    for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, opt, bufsize)
+        except OSError:
+            pass
+
+
+def _open_tcp(address, timeout, bufsize: int = 0, source_address=None) -> socket.socket:
+    """socket.create_connection with the buffer sizes applied before the handshake."""
+    host, port = address
+    err = None
+    for af, socktype, proto, _canon, sa in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM):
+        sock = None
+        try:
+            sock = socket.socket(af, socktype, proto)
+            _set_buffers(sock, bufsize)
+            if timeout is not socket._GLOBAL_DEFAULT_TIMEOUT:
+                sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sa)
+            _set_nodelay(sock)
+            return sock
+        except OSError as e:
+            err = e
+            if sock is not None:
+                sock.close()
+    if err is not None:
+        raise err
+    raise OSError(f"getaddrinfo returned nothing for {host}:{port}")
+
+
+class _FTP(FTP):
+    # bytes for SO_RCVBUF/SO_SNDBUF on data sockets; 0 leaves the OS autotuning alone
+    sock_bufsize = 0
+
+    def makeport(self):
+        sock = super().makeport()
+        # accepted data sockets inherit the listener's buffers (set before the handshake)
+        _set_buffers(sock, self.sock_bufsize)
+        return sock
+
+    def ntransfercmd(self, cmd, rest=None):
+        if not self.passiveserver or self.sock_bufsize <= 0:
+            conn, size = super().ntransfercmd(cmd, rest)
+            _set_nodelay(conn)
+            return conn, size
+
+        # passive path of FTP.ntransfercmd, with the data socket built by _open_tcp
+        size = None
+        host, port = self.makepasv()
+        conn = _open_tcp((host, port), self.timeout, self.sock_bufsize, self.source_address)
+        try:
+            if rest is not None:
+                self.sendcmd("REST %s" % rest)
+            resp = self.sendcmd(cmd)
+            if resp[0] == "2":
+                resp = self.getresp()
+            if resp[0] != "1":
+                raise error_reply(resp)
+        except BaseException:
+            conn.close()
+            raise
+        if resp[:3] == "150":
+            size = parse150(resp)
+        return conn, size
+
+
+class _FTP_TLS(FTP_TLS, _FTP):
+    # MRO: FTP_TLS.ntransfercmd wraps the socket returned by _FTP.ntransfercmd
+    pass
+
 
 class FtpClient(RemoteClientBase):
     def __init__(self, prof: ServerProfile):
         self.p = prof
         self.ftp = None
+        self._cur_dir: Optional[str] = None
+        self._abs_paths: Optional[bool] = None
+        self._tz_shift_sec = int(prof.tz_offset_min) * 60
+        self._feat: set = set()
+        self._has_mlsd = self._has_mlst = self._has_size = self._has_mdtm = False
+        self._has_mlsc = False
+        self._ldc: Dict[str, Tuple[float, List[RemoteEntry]]] = {}
         self.protocol = prof.protocol.lower().strip()
 
     def connect(self):
-        ftp = FTP_TLS() if self.protocol == "ftps" else FTP()
+        ftp = _FTP_TLS() if self.protocol == "ftps" else _FTP()
+        ftp.sock_bufsize = int(self.p.socket_buffer_kb or 0) * 1024
         ftp.connect(self.p.host, self.p.port, timeout=self.p.timeout)
+        # Don't let Nagle hold back pipelined MDTM/SIZE commands.
+        _set_nodelay(ftp.sock)
         ftp.login(self.p.user, self.p.password)
         if self.protocol == "ftps":
             ftp.prot_p()
         ftp.set_pasv(self.p.passive)
         self.ftp = ftp
+        self._cur_dir = None
+        self._feat = self._probe_features()
+        # RFC 3659 advertises MLSD under the MLST feature. Without a FEAT
+        # reply, assume support and drop each command on its first 500/502.
+        known = bool(self._feat)
+        self._has_mlsd = self._has_mlst = "MLST" in self._feat or not known
+        self._has_size = "SIZE" in self._feat or not known
+        self._has_mdtm = "MDTM" in self._feat or not known
+        self._has_mlsc = "MLSC" in self._feat
+
+    def _probe_features(self) -> set:
+        # FEAT reply: "211-Features:\n MLST type*;size*;\n SIZE\n211 End"
+        try:
+            lines = self.ftp.sendcmd("FEAT").splitlines()
+        except Exception:
+            return set()
+        return {ln.strip().split(" ", 1)[0].upper() for ln in lines[1:-1] if ln.strip()}
+
+    def is_alive(self) -> bool:
+        try:
+            self.ftp.voidcmd("NOOP")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _unsupported(e: Exception) -> bool:
+        return isinstance(e, error_perm) and str(e)[:3] in ("500", "502", "504")
 
     def close(self):
         try:
@@ -510,63 +831,236 @@ class FtpClient(RemoteClientBase):
         self.ftp = None
 
     def _cwd(self, path: str):
-        self.ftp.cwd(path or "/")
+        path = path or "/"
+        if path != self._cur_dir:
+            self._cur_dir = None
+            self.ftp.cwd(path)
+            self._cur_dir = path
+
+    _BAD_PATH_RE = re.compile(r"invalid|illegal|syntax|not allowed|bad (?:path|file ?name)", re.IGNORECASE)
+
+    @classmethod
+    def _path_rejected(cls, e: error_perm) -> bool:
+        # a syntax/unsupported reply, or a 550 that blames the path form rather than the file
+        msg = str(e)
+        code = msg[:3]
+        if code in ("500", "501", "502", "504"):
+            return True
+        return code == "550" and cls._BAD_PATH_RE.search(msg) is not None
+
+    def _path_cmd(self, fn, path: str):
+        """Call fn with the absolute path, or with the bare name after a CWD.
+
+        Servers that reject absolute paths are remembered, so the probe costs
+        one failed command per connection. Only path-form rejections trigger the
+        fallback, and it only sticks once the CWD + bare name call has worked;
+        an ordinary "550 No such file" is raised as-is.
+        """
+        d, name = os.path.split(path.rstrip("/"))
+        if self._abs_paths is not False:
+            try:
+                result = fn(path)
+                self._abs_paths = True
+                return result
+            except error_perm as e:
+                if self._abs_paths or not self._path_rejected(e):
+                    raise
+            self._cwd(d or "/")
+            result = fn(name)
+            self._abs_paths = False
+            return result
+        self._cwd(d or "/")
+        return fn(name)
+
+    def _parse_mdtm(self, resp: str) -> Optional[int]:
+        parts = resp.split()
+        if len(parts) >= 2 and parts[0] == "213":
+            epoch = _ftp_time_to_epoch(parts[1])
+            if epoch is not None:
+                return epoch + self._tz_shift_sec
+        return None
 
     def _mdtm_epoch(self, name: str) -> Optional[int]:
+        if not self._has_mdtm:
+            return None
         try:
-            resp = self.ftp.sendcmd(f"MDTM {name}")
-            parts = resp.split()
-            if len(parts) >= 2 and parts[0] == "213":
-                s = parts[1].strip()
-                if len(s) == 14:
-                    tt = time.strptime(s, "%Y%m%d%H%M%S")
-                    epoch = calendar.timegm(tt)
-                    epoch += int(self.p.tz_offset_min) * 60
-                    return int(epoch)
-        except Exception:
+            return self._parse_mdtm(self.ftp.sendcmd(f"MDTM {name}"))
+        except Exception as e:
+            if self._unsupported(e):
+                self._has_mdtm = False
             return None
-        return None
 
     def _size(self, name: str) -> Optional[int]:
+        if not self._has_size:
+            return None
         try:
             return self.ftp.size(name)
-        except Exception:
+        except Exception as e:
+            if self._unsupported(e):
+                self._has_size = False
             return None
 
-    def list_dir(self, path: str) -> List[RemoteEntry]:
+    def _batch_mdtm_size(self, names: List[str]) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """Return {name: (size, mtime)}, pipelining MDTM/SIZE on the control channel.
+
+        Requests go out in chunks so neither side's socket buffer fills while
+        the other is still writing. If the exchange breaks off part-way, unread
+        replies are still queued on the control channel, so the connection is
+        dropped and the error raised; the pool then discards this client.
+        """
+        out: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        if not (self._has_mdtm and self._has_size):
+            return {n: (self._size(n), self._mdtm_epoch(n)) for n in names}
+        try:
+            for i in range(0, len(names), MDTM_PIPELINE_CHUNK):
+                chunk = names[i:i + MDTM_PIPELINE_CHUNK]
+                self.ftp.sock.sendall(b"".join(
+                    f"MDTM {n}\r\nSIZE {n}\r\n".encode(self.ftp.encoding) for n in chunk
+                ))
+                for n in chunk:
+                    mtime_resp = self.ftp.getmultiline()
+                    size_resp = self.ftp.getmultiline()
+                    size = None
+                    if size_resp[:3] == "213":
+                        try:
+                            size = int(size_resp[3:].strip())
+                        except ValueError:
+                            size = None
+                    try:
+                        mtime = self._parse_mdtm(mtime_resp)
+                    except ValueError:
+                        mtime = None
+                    out[n] = (size, mtime)
+            return out
+        except Exception as e:
+            ftp, self.ftp = self.ftp, None
+            try:
+                ftp.close()  # no QUIT: its reply would be one of the stale ones
+            except Exception:
+                pass
+            raise ConnectionError(f"FTP control channel out of sync after pipelined MDTM/SIZE: {e}") from e
+
+    def _entry_from_facts(self, name: str, facts: Dict[str, str]) -> RemoteEntry:
+        is_dir = facts.get("type", "") in ("dir", "cdir")
+        size = None
+        mtime = None
+        if not is_dir and "size" in facts:
+            try:
+                size = int(facts["size"])
+            except Exception:
+                size = None
+        if "modify" in facts:
+            mtime = _ftp_time_to_epoch(facts["modify"])
+            if mtime is not None:
+                mtime += self._tz_shift_sec
+        return RemoteEntry(name=name, is_dir=is_dir, size=size, mtime=mtime)
+
+    @staticmethod
+    def _split_fact_line(line: str) -> Tuple[Dict[str, str], str]:
+        # "type=file;size=12;modify=20240101120000; name" (MLST lines have a leading space)
+        if line.startswith(" "):
+            line = line[1:]
+        fact_str, _, name = line.partition(" ")
+        facts: Dict[str, str] = {}
+        for fact in fact_str.rstrip(";").split(";"):
+            key, _, value = fact.partition("=")
+            if value:
+                facts[key.lower()] = value
+        return facts, name
+
+    def _mlst(self, path: str) -> RemoteEntry:
+        # 250-Listing <path>\n <facts>; <path>\n250 End
+        lines = self.ftp.sendcmd(f"MLST {path}").splitlines()
+        facts = self._split_fact_line(lines[1])[0] if len(lines) > 2 else {}
+        return self._entry_from_facts(os.path.basename(path.rstrip("/")), facts)
+
+    def _mlsc(self, path: str) -> List[RemoteEntry]:
+        # MLSD-format listing sent on the control channel, so no data connection
+        # (PASV plus, on FTPS, a TLS handshake) is opened per directory.
+        resp = self.ftp.sendcmd(f"MLSC {path}")
+        lines = resp.splitlines()[1:-1]
+        if resp[:1] == "1":
+            # 150 ... <lines> 226 ...: the body follows the preliminary reply
+            lines = []
+            while True:
+                line = self.ftp.getline()
+                if _FINAL_REPLY_RE.match(line):
+                    if line[:1] != "2":
+                        raise error_perm(line)
+                    break
+                lines.append(line)
+        out: List[RemoteEntry] = []
+        for line in lines:
+            facts, name = self._split_fact_line(line)
+            if not name or name in (".", "..") or facts.get("type") in ("cdir", "pdir"):
+                continue
+            out.append(self._entry_from_facts(name, facts))
+        return out
+
+    def _list_dir(self, path: str) -> List[RemoteEntry]:
+        if self._has_mlsc:
+            try:
+                return self._mlsc(path)
+            except Exception as e:
+                if self._unsupported(e):
+                    self._has_mlsc = False
         self._cwd(path)
         out: List[RemoteEntry] = []
+        if self._has_mlsd:
+            try:
+                for name, facts in self.ftp.mlsd():
+                    if name in (".", ".."):
+                        continue
+                    out.append(self._entry_from_facts(name, facts))
+                return out
+            except Exception as e:
+                if self._unsupported(e):
+                    self._has_mlsd = False
+                out = []
+
+        lines: List[str] = []
         try:
-            for name, facts in self.ftp.mlsd():
+            self.ftp.retrlines("LIST", lines.append)
+        except Exception:
+            lines = []
+        lines = [ln for ln in lines if ln.strip() and not ln.startswith("total ")]
+        parsed = [parse_list_line(ln, self.p.tz_offset_min) for ln in lines]
+        misses = sum(1 for x in parsed if x is None)
+        if lines and misses * 2 <= len(lines):
+            cur = None
+            for x in parsed:
+                if x is None:
+                    continue
+                is_dir, size, mtime, name, precision = x
                 if name in (".", ".."):
                     continue
-                is_dir = facts.get("type", "") == "dir"
-                size = None
-                mtime = None
-                if not is_dir and "size" in facts:
+                if is_dir is None:
+                    # Symlink: resolve the target type with a CWD probe.
+                    cur = cur or self.ftp.pwd()
                     try:
-                        size = int(facts["size"])
+                        self.ftp.cwd(name)
+                        self.ftp.cwd(cur)
+                        is_dir = True
                     except Exception:
-                        size = None
-                if "modify" in facts:
-                    s = facts["modify"]
-                    if len(s) == 14:
-                        try:
-                            tt = time.strptime(s, "%Y%m%d%H%M%S")
-                            mtime = calendar.timegm(tt) + int(self.p.tz_offset_min) * 60
-                        except Exception:
-                            mtime = None
-                out.append(RemoteEntry(name=name, is_dir=is_dir, size=size, mtime=mtime))
+                        is_dir = False
+                    if not is_dir:
+                        size = self._size(name)
+                out.append(RemoteEntry(
+                    name=name, is_dir=is_dir, size=None if is_dir else size,
+                    mtime=mtime, mtime_precision=precision,
+                ))
             return out
-        except Exception:
-            pass
+        return self._probe_entries()
 
+    def _probe_entries(self) -> List[RemoteEntry]:
+        out: List[RemoteEntry] = []
         try:
             names = self.ftp.nlst()
         except Exception:
             names = []
 
         cur = self.ftp.pwd()
+        files: List[str] = []
         for n in names:
             if n in (".", ".."):
                 continue
@@ -581,26 +1075,36 @@ class FtpClient(RemoteClientBase):
             if is_dir:
                 out.append(RemoteEntry(name=n, is_dir=True))
             else:
-                out.append(RemoteEntry(name=n, is_dir=False, size=self._size(n), mtime=self._mdtm_epoch(n)))
+                files.append(n)
+
+        for n, (size, mtime) in self._batch_mdtm_size(files).items():
+            out.append(RemoteEntry(name=n, is_dir=False, size=size, mtime=mtime))
         return out
 
     def ensure_dir(self, path: str):
         if not path or path == "/":
             return
-        parts = [p for p in path.split("/") if p]
-        cur = "/"
-        for part in parts:
-            nxt = cur + part if cur.endswith("/") else cur + "/" + part
+
+        def _exists(p: str) -> bool:
             try:
-                self.ftp.cwd(nxt)
+                self.ftp.cwd(p)
             except Exception:
-                try:
-                    self.ftp.mkd(nxt)
-                except Exception:
-                    pass
-            cur = nxt + "/"
+                return False
+            self._cur_dir = p
+            return True
+
+        self._make_dirs(path, _exists, self.ftp.mkd)
 
     def stat(self, path: str) -> Optional[RemoteEntry]:
+        if self._has_mlst:
+            try:
+                return self._mlst(path)
+            except error_perm as e:
+                if not self._unsupported(e):
+                    return None
+                self._has_mlst = False
+            except Exception:
+                return None
         try:
             d, name = os.path.split(path.rstrip("/"))
             if not d:
@@ -616,32 +1120,47 @@ class FtpClient(RemoteClientBase):
         except Exception:
             return None
 
-    def download(self, remote_path: str, local_path: str, progress_cb=None):
-        d, name = os.path.split(remote_path.rstrip("/"))
-        if not d:
-            d = "/"
-        self._cwd(d)
+    def download(self, remote_path: str, local_path: str, progress_cb=None, known_entry: Optional[RemoteEntry] = None):
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
         with open(local_path, "wb") as f:
-            def _write(chunk: bytes):
-                f.write(chunk)
+            # recv() hands back far less than blocksize on fast links; gather the
+            # pieces and write/report once per TRANSFER_BLOCKSIZE.
+            buf = bytearray()
+
+            def _flush():
+                f.write(buf)
                 if progress_cb:
-                    progress_cb(len(chunk), None, None)
-            self.ftp.retrbinary(f"RETR {name}", _write, blocksize=64 * 1024)
-        m = self._mdtm_epoch(name)
+                    progress_cb(len(buf), None, None)
+                buf.clear()
+
+            def _write(chunk: bytes):
+                buf.extend(chunk)
+                if len(buf) >= TRANSFER_BLOCKSIZE:
+                    _flush()
+
+            def _retr(arg: str):
+                f.seek(0)
+                f.truncate()
+                buf.clear()
+                self.ftp.retrbinary(f"RETR {arg}", _write, blocksize=TRANSFER_BLOCKSIZE)
+
+            self._path_cmd(_retr, remote_path)
+            if buf:
+                _flush()
+        if known_entry is not None and known_entry.mtime is not None:
+            m = int(known_entry.mtime)
+        else:
+            m = self._mdtm_epoch(remote_path if self._abs_paths else os.path.basename(remote_path.rstrip("/")))
         if m is not None:
             try:
                 os.utime(local_path, (m, m))
             except Exception:
                 pass
 
-    def upload(self, local_path: str, remote_path: str, progress_cb=None):
-        d, name = os.path.split(remote_path.rstrip("/"))
-        if not d:
-            d = "/"
+    def upload(self, local_path: str, remote_path: str, progress_cb=None, size: Optional[int] = None):
+        d = os.path.dirname(remote_path.rstrip("/")) or "/"
         self.ensure_dir(d)
-        self._cwd(d)
-        total = os.path.getsize(local_path)
+        total = size if size is not None else os.path.getsize(local_path)
         done = 0
 
         def _cb(block: bytes):
@@ -651,7 +1170,11 @@ class FtpClient(RemoteClientBase):
                 progress_cb(len(block), done, total)
 
         with open(local_path, "rb") as f:
-            self.ftp.storbinary(f"STOR {name}", f, blocksize=64 * 1024, callback=_cb)
+            def _stor(arg: str):
+                f.seek(0)
+                self.ftp.storbinary(f"STOR {arg}", f, blocksize=TRANSFER_BLOCKSIZE, callback=_cb)
+            self._path_cmd(_stor, remote_path)
+        self.invalidate(d)
 
 
 class SftpClient(RemoteClientBase):
@@ -661,15 +1184,28 @@ class SftpClient(RemoteClientBase):
         self.p = prof
         self.transport = None
         self.sftp = None
+        self._ldc: Dict[str, Tuple[float, List[RemoteEntry]]] = {}
 
     def connect(self):
-        t = paramiko.Transport((self.p.host, self.p.port))
+        sock = _open_tcp(
+            (self.p.host, self.p.port),
+            self.p.timeout,
+            int(self.p.socket_buffer_kb or 0) * 1024,
+        )
+        t = paramiko.Transport(
+            sock,
+            default_window_size=SFTP_WINDOW_SIZE,
+            default_max_packet_size=SFTP_MAX_PACKET_SIZE,
+        )
         t.banner_timeout = self.p.timeout
         t.auth_timeout = self.p.timeout
         t.connect(username=self.p.user, password=self.p.password)
         self.transport = t
         self.sftp = paramiko.SFTPClient.from_transport(t)
 
+    def is_alive(self) -> bool:
+        return bool(self.transport is not None and self.transport.is_active())
+
     def close(self):
         try:
             if self.sftp:
@@ -684,33 +1220,30 @@ class SftpClient(RemoteClientBase):
         self.sftp = None
         self.transport = None
 
-    def list_dir(self, path: str) -> List[RemoteEntry]:
-        out: List[RemoteEntry] = []
-        for a in self.sftp.listdir_attr(path or "/"):
-            is_dir = bool(a.st_mode & 0o040000)
-            out.append(RemoteEntry(name=a.filename, is_dir=is_dir, size=int(a.st_size), mtime=int(a.st_mtime)))
-        return out
+    def _list_dir(self, path: str) -> List[RemoteEntry]:
+        return [
+            RemoteEntry(name=a.filename, is_dir=S_ISDIR(a.st_mode), size=int(a.st_size), mtime=int(a.st_mtime))
+            for a in self.sftp.listdir_attr(path or "/")
+            if a.filename not in (".", "..")
+        ]
 
     def ensure_dir(self, path: str):
         if not path or path in ("/", "."):
             return
-        parts = [p for p in path.split("/") if p]
-        cur = "/"
-        for part in parts:
-            nxt = cur + part if cur.endswith("/") else cur + "/" + part
+
+        def _exists(p: str) -> bool:
             try:
-                self.sftp.stat(nxt)
+                self.sftp.stat(p)
             except Exception:
-                try:
-                    self.sftp.mkdir(nxt)
-                except Exception:
-                    pass
-            cur = nxt + "/"
+                return False
+            return True
+
+        self._make_dirs(path, _exists, self.sftp.mkdir)
 
     def stat(self, path: str) -> Optional[RemoteEntry]:
         try:
             s = self.sftp.stat(path)
-            is_dir = bool(s.st_mode & 0o040000)
+            is_dir = S_ISDIR(s.st_mode)
             return RemoteEntry(
                 name=os.path.basename(path.rstrip("/")),
                 is_dir=is_dir,
@@ -720,21 +1253,25 @@ class SftpClient(RemoteClientBase):
         except Exception:
             return None
 
-    def download(self, remote_path: str, local_path: str, progress_cb=None):
+    def download(self, remote_path: str, local_path: str, progress_cb=None, known_entry: Optional[RemoteEntry] = None):
         os.makedirs(os.path.dirname(local_path), exist_ok=True)
 
         def cb(transferred, total):
             if progress_cb:
                 progress_cb(None, int(transferred), int(total))
 
+        # get() already prefetches, keeping many reads in flight
         self.sftp.get(remote_path, local_path, callback=cb)
         try:
-            st = self.sftp.stat(remote_path)
-            os.utime(local_path, (int(st.st_mtime), int(st.st_mtime)))
+            if known_entry is not None and known_entry.mtime is not None:
+                m = int(known_entry.mtime)
+            else:
+                m = int(self.sftp.stat(remote_path).st_mtime)
+            os.utime(local_path, (m, m))
         except Exception:
             pass
 
-    def upload(self, local_path: str, remote_path: str, progress_cb=None):
+    def upload(self, local_path: str, remote_path: str, progress_cb=None, size: Optional[int] = None):
         d = os.path.dirname(remote_path.rstrip("/")) or "/"
         self.ensure_dir(d)
 
@@ -742,7 +1279,9 @@ class SftpClient(RemoteClientBase):
             if progress_cb:
                 progress_cb(None, int(transferred), int(total))
 
+        # put() pipelines its writes and reports the size itself
         self.sftp.put(local_path, remote_path, callback=cb)
+        self.invalidate(d)
 
 
 
@@ -751,80 +1290,232 @@ def make_client(profile: ServerProfile) -> RemoteClientBase:
     return SftpClient(profile) if proto == "sftp" else FtpClient(profile)
 
 
+_idle_clients: Dict[tuple, List[Tuple[float, RemoteClientBase]]] = {}
+_idle_lock = threading.Lock()
+
+
+def _profile_key(profile: ServerProfile) -> tuple:
+    # any edit to the profile (host, credentials, ...) gets fresh connections
+    return tuple(getattr(profile, f.name) for f in fields(profile))
+
+
+def _close_quietly(client: RemoteClientBase) -> None:
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+def get_client(profile: ServerProfile) -> RemoteClientBase:
+    """Hand out an idle connected client for `profile`, or connect a new one.
+
+    Idle clients are checked with a NOOP / transport test first, so a
+    connection the server dropped is never returned.
+    """
+    key = _profile_key(profile)
+    while True:
+        with _idle_lock:
+            idle = _idle_clients.get(key)
+            item = idle.pop() if idle else None
+        if item is None:
+            break
+        ts, c = item
+        if time.monotonic() - ts < CLIENT_MAX_IDLE_SEC and c.is_alive():
+            c.invalidate()
+            return c
+        _close_quietly(c)
+    c = make_client(profile)
+    c.connect()
+    return c
+
+
+def release_client(profile: ServerProfile, client: RemoteClientBase) -> None:
+    with _idle_lock:
+        _idle_clients.setdefault(_profile_key(profile), []).append((time.monotonic(), client))
+
+
+def take_expired_clients(max_idle: float = CLIENT_MAX_IDLE_SEC) -> List[RemoteClientBase]:
+    """Remove idle clients older than max_idle from the cache and return them, still open."""
+    now = time.monotonic()
+    stale: List[RemoteClientBase] = []
+    with _idle_lock:
+        for key in list(_idle_clients):
+            keep = []
+            for ts, c in _idle_clients[key]:
+                if now - ts < max_idle:
+                    keep.append((ts, c))
+                else:
+                    stale.append(c)
+            if keep:
+                _idle_clients[key] = keep
+            else:
+                del _idle_clients[key]
+    return stale
+
+
+class ConnectionPool:
+    """Up to `size` connected clients for one profile, opened on first use.
+
+    Each SFTP client owns its own Transport, so pooled transfers really run
+    on separate connections.
+    """
+
+    def __init__(self, profile: ServerProfile, size: int):
+        self.profile = profile
+        self.size = max(1, int(size))
+        self._slots = threading.Semaphore(self.size)
+        self._lock = threading.Lock()
+        self._idle: List[RemoteClientBase] = []
+
+    @contextlib.contextmanager
+    def client(self):
+        with self._slots:
+            with self._lock:
+                c = self._idle.pop() if self._idle else None
+            if c is None:
+                c = get_client(self.profile)
+            try:
+                yield c
+            except BaseException:
+                # The session may be mid-transfer; don't hand it out again.
+                _close_quietly(c)
+                raise
+            with self._lock:
+                self._idle.append(c)
+
+    def invalidate(self):
+        with self._lock:
+            for c in self._idle:
+                c.invalidate()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for c in idle:
+            release_client(self.profile, c)
+
+
 # ------------------------------------------------------------
 # Sync logic
 # ------------------------------------------------------------
-def walk_remote(client: RemoteClientBase, base_dir: str, recursive: bool) -> List[Tuple[str, RemoteEntry]]:
+def walk_remote(client: RemoteClientBase, base_dir: str, recursive: bool,
+                pool: Optional[ConnectionPool] = None,
+                name_filter: Optional[Callable[[str], object]] = None) -> List[Tuple[str, RemoteEntry]]:
     results: List[Tuple[str, RemoteEntry]] = []
+    pending = deque([(base_dir, "")])
+    ex = ThreadPoolExecutor(max_workers=pool.size) if pool is not None and recursive else None
 
-    def _walk(cur_dir: str, rel_prefix: str):
-        entries = client.list_dir(cur_dir)
-        for e in entries:
-            if e.name in (".", ".."):
-                continue
-            rpath = _join_remote(cur_dir, e.name)
-            rel = e.name if not rel_prefix else f"{rel_prefix}/{e.name}"
-            if e.is_dir:
-                if recursive:
-                    _walk(rpath, rel)
-            else:
-                results.append((rel, e))
+    def _list_pooled(cur_dir: str) -> List[RemoteEntry]:
+        with pool.client() as c:
+            return c.list_dir(cur_dir)
 
-    _walk(base_dir, "")
+    try:
+        while pending:
+            # Breadth-first: every directory found on one level is listed as a batch,
+            # spread over the pool's connections when there is one.
+            batch = [pending.popleft() for _ in range(len(pending))]
+            if ex is not None and len(batch) > 1:
+                listings = ex.map(_list_pooled, [cur_dir for cur_dir, _ in batch])
+            else:
+                listings = (client.list_dir(cur_dir) for cur_dir, _ in batch)
+            for (cur_dir, rel_prefix), entries in zip(batch, listings):
+                for e in entries:
+                    if e.name in (".", ".."):
+                        continue
+                    rel = e.name if not rel_prefix else f"{rel_prefix}/{e.name}"
+                    if e.is_dir:
+                        if recursive:
+                            pending.append((_join_remote(cur_dir, e.name), rel))
+                    elif name_filter is None or name_filter(e.name):
+                        results.append((rel, e))
+    finally:
+        if ex is not None:
+            ex.shutdown()
     return results
 
 
 
-def local_walk(base_dir: str, recursive: bool) -> List[str]:
-    out: List[str] = []
-    if recursive:
-        for root, _, files in os.walk(base_dir):
-            for f in files:
-                rel = os.path.relpath(os.path.join(root, f), base_dir).replace("\\", "/")
-                out.append(rel)
-    else:
-        for f in os.listdir(base_dir):
-            p = os.path.join(base_dir, f)
-            if os.path.isfile(p):
-                out.append(f)
+def _scan_local_dir(cur_dir: str, rel_prefix: str) -> Tuple[List[Tuple[str, Tuple[int, int]]], List[Tuple[str, str]]]:
+    files: List[Tuple[str, Tuple[int, int]]] = []
+    subdirs: List[Tuple[str, str]] = []
+    try:
+        it = os.scandir(cur_dir)
+    except OSError:
+        return files, subdirs
+    with it:
+        for entry in it:
+            rel = entry.name if not rel_prefix else f"{rel_prefix}/{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, rel))
+                elif entry.is_file():
+                    st = entry.stat()
+                    files.append((rel, (st.st_size, int(st.st_mtime))))
+            except OSError:
+                continue
+    return files, subdirs
+
+
+
+def local_walk_with_stats(base_dir: str, recursive: bool, workers: int = 1) -> Dict[str, Tuple[int, int]]:
+    """Map each local file's relative path ("/"-separated) to (size, mtime).
+
+    Uses one scandir pass so each file costs a single stat call. With
+    workers > 1 the directories of each tree level are scanned concurrently,
+    which overlaps latency on network shares and NAS volumes.
+    """
+    out: Dict[str, Tuple[int, int]] = {}
+    pending = [(base_dir, "")]
+    ex = ThreadPoolExecutor(max_workers=workers) if recursive and workers > 1 else None
+    try:
+        while pending:
+            if ex is not None and len(pending) > 1:
+                scans = ex.map(lambda d: _scan_local_dir(*d), pending)
+            else:
+                scans = (_scan_local_dir(*d) for d in pending)
+            level: List[Tuple[str, str]] = []
+            for files, subdirs in scans:
+                out.update(files)
+                if recursive:
+                    level.extend(subdirs)
+            pending = level
+    finally:
+        if ex is not None:
+            ex.shutdown()
     return out
 
 
 
-def should_transfer(remote_e: Optional[RemoteEntry], local_path: str) -> bool:
-    if not os.path.exists(local_path):
+def _newer(t: int, ref: int, ref_precision: int = 1) -> bool:
+    # ref only says "somewhere in [ref, ref + precision)"; 1 s of slack for exact stamps
+    return t > ref + max(1, ref_precision)
+
+
+def should_transfer(remote_e: Optional[RemoteEntry], local_st: Optional[Tuple[int, int]]) -> bool:
+    if local_st is None:
         return True
     if remote_e is None:
         return False
-    try:
-        ls = os.path.getsize(local_path)
-        lm = int(os.path.getmtime(local_path))
-    except Exception:
-        return True
+    ls, lm = local_st
     if remote_e.size is not None and remote_e.size != ls:
         return True
-    if remote_e.mtime is not None and remote_e.mtime > lm + 1:
+    # a truncated LIST stamp is the lower bound of the real time, so this never over-triggers
+    if remote_e.mtime is not None and _newer(remote_e.mtime, lm):
         return True
     return False
 
 
-
-def should_download(remote_e: Optional[RemoteEntry], local_path: str, new_only: bool) -> bool:
-    return (not os.path.exists(local_path)) if new_only else should_transfer(remote_e, local_path)
+def should_download(remote_e: Optional[RemoteEntry], local_st: Optional[Tuple[int, int]], new_only: bool) -> bool:
+    return (local_st is None) if new_only else should_transfer(remote_e, local_st)
 
 
-
-def should_upload(local_path: str, remote_e: Optional[RemoteEntry]) -> bool:
+def should_upload(local_st: Tuple[int, int], remote_e: Optional[RemoteEntry]) -> bool:
     if remote_e is None:
         return True
-    try:
-        ls = os.path.getsize(local_path)
-        lm = int(os.path.getmtime(local_path))
-    except Exception:
-        return True
+    ls, lm = local_st
     if remote_e.size is not None and remote_e.size != ls:
         return True
-    if remote_e.mtime is not None and lm > remote_e.mtime + 1:
+    if remote_e.mtime is not None and _newer(lm, remote_e.mtime, remote_e.mtime_precision):
         return True
     return False
 
@@ -832,6 +1523,38 @@ def should_upload(local_path: str, remote_e: Optional[RemoteEntry]) -> bool:
 # ------------------------------------------------------------
 # Dialogs
 # ------------------------------------------------------------
+class _ListSignals(QtCore.QObject):
+    loaded = QtCore.Signal(str, object)
+    failed = QtCore.Signal(str, str)
+
+
+class _ListTask(QtCore.QRunnable):
+    def __init__(self, client: RemoteClientBase, path: str):
+        super().__init__()
+        self.client = client
+        self.path = path
+        self.signals = _ListSignals()
+
+    def run(self):
+        try:
+            entries = self.client.list_dir(self.path)
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+            return
+        self.signals.loaded.emit(self.path, entries)
+
+
+class _CloseClientsTask(QtCore.QRunnable):
+    # QUIT to a slow or dead server can block for the whole socket timeout
+    def __init__(self, clients: List[RemoteClientBase]):
+        super().__init__()
+        self.clients = clients
+
+    def run(self):
+        for c in self.clients:
+            _close_quietly(c)
+
+
 class RemoteFolderPicker(QtWidgets.QDialog):
     def __init__(self, parent, profile: ServerProfile):
         super().__init__(parent)
@@ -840,6 +1563,10 @@ class RemoteFolderPicker(QtWidgets.QDialog):
         self.setStyleSheet(APP_STYLE)
         self.profile = profile
         self.client: Optional[RemoteClientBase] = None
+        # one listing at a time: the client holds a single control connection
+        self._list_pool = QtCore.QThreadPool(self)
+        self._list_pool.setMaxThreadCount(1)
+        self._loading: Dict[str, QtWidgets.QTreeWidgetItem] = {}
 
         self.tree = QtWidgets.QTreeWidget()
         self.tree.setHeaderLabels(["Remote folders"])
@@ -882,24 +1609,42 @@ class RemoteFolderPicker(QtWidgets.QDialog):
         if not self.client:
             return
         path = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-        if not path:
+        if not path or path in self._loading:
+            return
+        if not (item.childCount() == 1 and item.child(0).text(0) == "(loading...)"):
             return
-        if item.childCount() == 1 and item.child(0).text(0) == "(loading...)":
+        # List off the GUI thread; the placeholder stays until the result arrives.
+        self._loading[path] = item
+        task = _ListTask(self.client, path)
+        task.signals.loaded.connect(self._on_loaded)
+        task.signals.failed.connect(self._on_failed)
+        self._list_pool.start(task)
+
+    def _take_pending(self, path: str) -> Optional[QtWidgets.QTreeWidgetItem]:
+        item = self._loading.pop(path, None)
+        if item is not None and item.childCount() == 1 and item.child(0).text(0) == "(loading...)":
             item.takeChild(0)
-        elif item.childCount() > 0:
+        return item
+
+    def _on_loaded(self, path: str, entries: List[RemoteEntry]):
+        item = self._take_pending(path)
+        if item is None:
             return
-        try:
-            entries = self.client.list_dir(path)
-            dirs = [e for e in entries if e.is_dir and e.name not in (".", "..")]
-            dirs.sort(key=lambda x: x.name.lower())
-            for d in dirs:
-                child_path = _join_remote(path, d.name)
-                child = QtWidgets.QTreeWidgetItem([d.name])
-                child.setData(0, QtCore.Qt.ItemDataRole.UserRole, child_path)
-                child.addChild(QtWidgets.QTreeWidgetItem(["(loading...)"]))
-                item.addChild(child)
-        except Exception:
-            pass
+        dirs = [e for e in entries if e.is_dir and e.name not in (".", "..")]
+        dirs.sort(key=lambda x: x.name.lower())
+        for d in dirs:
+            child_path = _join_remote(path, d.name)
+            child = QtWidgets.QTreeWidgetItem([d.name])
+            child.setData(0, QtCore.Qt.ItemDataRole.UserRole, child_path)
+            child.addChild(QtWidgets.QTreeWidgetItem(["(loading...)"]))
+            item.addChild(child)
+
+    def _on_failed(self, path: str, err: str):
+        # keep the placeholder and collapse the node: expanding it again retries
+        item = self._loading.pop(path, None)
+        if item is not None:
+            item.setExpanded(False)
+        self.status.setText(f"Failed to list {path}: {err}")
 
     def selected_folder(self) -> str:
         it = self.tree.currentItem()
@@ -908,13 +1653,15 @@ class RemoteFolderPicker(QtWidgets.QDialog):
         path = it.data(0, QtCore.Qt.ItemDataRole.UserRole)
         return path or "/"
 
-    def closeEvent(self, event):
-        try:
-            if self.client:
-                self.client.close()
-        except Exception:
-            pass
-        event.accept()
+    def done(self, r):
+        # OK, Cancel and the close button all end here. Don't wait for a listing
+        # in flight: drop queued ones and let the listing thread close the client
+        # right after the running one returns.
+        self._list_pool.clear()
+        if self.client is not None:
+            self._list_pool.start(_CloseClientsTask([self.client]))
+            self.client = None
+        super().done(r)
 
 
 class ServerDialog(QtWidgets.QDialog):
@@ -945,6 +1692,14 @@ class ServerDialog(QtWidgets.QDialog):
         self.tz_offset.setSuffix(" min")
         self.tz_hint = QtWidgets.QLabel("FTP tz offset: keep 0 normally. Use only if MDTM times are wrong.")
         set_role(self.tz_hint, "muted")
+        self.parallel = QtWidgets.QSpinBox()
+        self.parallel.setRange(1, 16)
+        self.parallel.setValue(2)
+        self.sock_buf = QtWidgets.QSpinBox()
+        self.sock_buf.setRange(0, 64 * 1024)
+        self.sock_buf.setSingleStep(256)
+        self.sock_buf.setSuffix(" KiB")
+        self.sock_buf.setSpecialValueText("Auto (OS)")
 
         form = QtWidgets.QFormLayout()
         form.addRow("Name:", self.name)
@@ -957,6 +1712,8 @@ class ServerDialog(QtWidgets.QDialog):
         form.addRow("Timeout (s):", self.timeout)
         form.addRow("FTP tz offset:", self.tz_offset)
         form.addRow("", self.tz_hint)
+        form.addRow("Parallel transfers:", self.parallel)
+        form.addRow("Socket buffer:", self.sock_buf)
 
         btns = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok |
@@ -982,6 +1739,8 @@ class ServerDialog(QtWidgets.QDialog):
             self.passive.setChecked(server.passive)
             self.timeout.setValue(server.timeout)
             self.tz_offset.setValue(server.tz_offset_min)
+            self.parallel.setValue(int(server.parallel_transfers or 1))
+            self.sock_buf.setValue(int(server.socket_buffer_kb or 0))
             self._proto_changed(server.protocol)
 
     def _proto_changed(self, p: str):
@@ -1005,6 +1764,8 @@ class ServerDialog(QtWidgets.QDialog):
             passive=bool(self.passive.isChecked()),
             timeout=int(self.timeout.value()),
             tz_offset_min=int(self.tz_offset.value()),
+            parallel_transfers=int(self.parallel.value()),
+            socket_buffer_kb=int(self.sock_buf.value()),
         )
 
 
@@ -1109,6 +1870,7 @@ class JobDialog(QtWidgets.QDialog):
         self.setModal(True)
         self.setStyleSheet(APP_STYLE)
         self.servers = servers or []
+        self._server_by_name = {s.name: s for s in self.servers}
         self.groups = groups or []
 
         self.enabled = QtWidgets.QCheckBox("Enabled")
@@ -1216,7 +1978,7 @@ class JobDialog(QtWidgets.QDialog):
 
     def _pick_remote(self):
         srv_name = self.server.currentText()
-        prof = next((s for s in self.servers if s.name == srv_name), None)
+        prof = self._server_by_name.get(srv_name)
         if not prof:
             return
         dlg = RemoteFolderPicker(self, prof)
@@ -1281,13 +2043,13 @@ class JobRunnable(QtCore.QRunnable):
     def run(self):
         label = f"{self.job.group} | {self.job.server_name} | {self.job.remote_dir}"
         client: Optional[RemoteClientBase] = None
+        pool = ConnectionPool(self.profile, self.profile.parallel_transfers)
         try:
             self.signals.status.emit(f"[{label}] Connecting...")
-            client = make_client(self.profile)
-            client.connect()
+            client = get_client(self.profile)
             self.signals.log.emit(f"[{label}] Connected ({self.profile.protocol.upper()})")
             while not self.stop_event.is_set():
-                self._cycle(client, label)
+                self._cycle(client, pool, label)
                 if not self.job.monitor:
                     break
                 self.signals.status.emit(f"[{label}] Monitoring... sleep {self.job.interval_sec}s")
@@ -1297,56 +2059,87 @@ class JobRunnable(QtCore.QRunnable):
                     time.sleep(1)
             self.signals.status.emit(f"[{label}] Stopped.")
             self.signals.finished.emit(self.job_id, label)
+            release_client(self.profile, client)
+            client = None
         except Exception:
             self.signals.error.emit(self.job_id, label, traceback.format_exc())
         finally:
-            try:
-                if client:
-                    client.close()
-            except Exception:
-                pass
+            pool.close()
+            if client:
+                # only reached on error: the session state is unknown
+                _close_quietly(client)
+
+    def _run_transfers(self, pool: ConnectionPool, fn, tasks: List[tuple]):
+        def _one(args):
+            if self.stop_event.is_set():
+                return
+            with pool.client() as c:
+                fn(c, *args)
+
+        with ThreadPoolExecutor(max_workers=pool.size) as ex:
+            futures = [ex.submit(_one, args) for args in tasks]
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception:
+                    # the cycle has failed: don't let the executor's exit run the queued rest
+                    for f in futures:
+                        f.cancel()
+                    raise
 
-    def _cycle(self, client: RemoteClientBase, label: str):
+    def _cycle(self, client: RemoteClientBase, pool: ConnectionPool, label: str):
         j = self.job
         if not j.local_dir:
             self.signals.log.emit(f"[{label}] Local dir is empty -> skip")
             return
         os.makedirs(j.local_dir, exist_ok=True)
+        client.invalidate()
+        pool.invalidate()
         self.signals.status.emit(f"[{label}] Listing remote...")
-        remote_files = walk_remote(client, j.remote_dir, j.recursive)
         mask = j.mask.strip() or "*.*"
-        remote_files = [(rel, e) for (rel, e) in remote_files if fnmatch.fnmatch(os.path.basename(rel), mask)]
+        # "raw/2024/*.sgy": walk from raw/2024 on both sides instead of the job roots
+        dir_prefix, name_mask = split_mask(mask)
+        match = compile_mask(name_mask)
+        remote_root = _join_remote(j.remote_dir, dir_prefix) if dir_prefix else j.remote_dir
+        local_root = os.path.join(j.local_dir, dir_prefix.replace("/", os.sep)) if dir_prefix else j.local_dir
+        if dir_prefix and client.stat(remote_root) is None:
+            remote_files = []
+        else:
+            remote_files = walk_remote(client, remote_root, j.recursive, pool, name_filter=match)
         self.signals.log.emit(f"[{label}] Remote matched {len(remote_files)} files (mask={mask}, recursive={j.recursive})")
         remote_index: Dict[str, RemoteEntry] = {rel: e for rel, e in remote_files}
+        remote_prefix = _remote_prefix(remote_root)
+        local_stats = local_walk_with_stats(local_root, j.recursive, LOCAL_SCAN_WORKERS)
 
         if j.direction in ("download", "both"):
             self.signals.status.emit(f"[{label}] Checking downloads...")
+            # normcase keeps the old exists() semantics on case-insensitive file systems.
+            local_index = {os.path.normcase(rel): st for rel, st in local_stats.items()}
+            todo = []
             for rel, e in remote_files:
-                if self.stop_event.is_set():
-                    return
-                local_path = os.path.join(j.local_dir, rel.replace("/", os.sep))
-                if should_download(e, local_path, j.new_only):
-                    remote_path = _join_remote(j.remote_dir, rel)
-                    self._download_one(client, label, remote_path, local_path, e)
+                if should_download(e, local_index.get(os.path.normcase(rel)), j.new_only):
+                    local_path = os.path.join(local_root, rel.replace("/", os.sep))
+                    todo.append((label, remote_prefix + rel, local_path, e))
+            self._run_transfers(pool, self._download_one, todo)
+            if todo:
+                # Downloads changed the tree; don't upload them back on stale stats.
+                local_stats = local_walk_with_stats(local_root, j.recursive, LOCAL_SCAN_WORKERS)
 
         if self.stop_event.is_set():
             return
 
         if j.direction in ("upload", "both"):
             self.signals.status.emit(f"[{label}] Checking uploads...")
-            local_list = local_walk(j.local_dir, j.recursive)
-            local_list = [rel for rel in local_list if fnmatch.fnmatch(os.path.basename(rel), mask)]
-            for rel in local_list:
-                if self.stop_event.is_set():
-                    return
-                local_path = os.path.join(j.local_dir, rel.replace("/", os.sep))
-                re = remote_index.get(rel)
-                if re is None:
-                    remote_path = _join_remote(j.remote_dir, rel)
-                    re = client.stat(remote_path)
-                if should_upload(local_path, re):
-                    remote_path = _join_remote(j.remote_dir, rel)
-                    self._upload_one(client, label, local_path, remote_path)
+            # walk_remote listed every directory with the same recursion and mask as
+            # the local scan, so a path missing from remote_index is absent remotely.
+            todo = []
+            for rel, local_st in local_stats.items():
+                if match is not None and not match(rel.rsplit("/", 1)[-1]):
+                    continue
+                if should_upload(local_st, remote_index.get(rel)):
+                    local_path = os.path.join(local_root, rel.replace("/", os.sep))
+                    todo.append((label, local_path, remote_prefix + rel, local_st[0]))
+            self._run_transfers(pool, self._upload_one, todo)
 
         self.signals.status.emit(f"[{label}] Cycle complete.")
 
@@ -1354,37 +2147,44 @@ class JobRunnable(QtCore.QRunnable):
         total = int(e.size) if e.size is not None else 0
         done = 0
         file_label = f"[{label}] DL {remote_path}"
+        last_emit = 0
 
         def cb(delta, transferred=None, to_be=None):
-            nonlocal done, total
+            nonlocal done, total, last_emit
             if transferred is None:
                 done += int(delta or 0)
             else:
                 done = int(transferred)
                 total = int(to_be or total or 0)
-            self.signals.progress.emit(file_label, done, total)
+            now = time.monotonic_ns()
+            if now - last_emit >= PROGRESS_EMIT_INTERVAL_NS:
+                last_emit = now
+                self.signals.progress.emit(file_label, done, total)
 
         self.signals.log.emit(f"{file_label} -> {local_path}")
-        client.download(remote_path, local_path, progress_cb=cb)
+        client.download(remote_path, local_path, progress_cb=cb, known_entry=e)
         self.signals.progress.emit(file_label, total or done, total or done)
 
-    def _upload_one(self, client: RemoteClientBase, label: str, local_path: str, remote_path: str):
-        total = os.path.getsize(local_path)
+    def _upload_one(self, client: RemoteClientBase, label: str, local_path: str, remote_path: str, total: int):
         done = 0
         file_label = f"[{label}] UL {remote_path}"
+        last_emit = 0
 
         def cb(delta, transferred=None, to_be=None):
-            nonlocal done, total
+            nonlocal done, total, last_emit
             if transferred is None:
                 if isinstance(delta, int):
                     done = min(total, done + delta)
             else:
                 done = int(transferred)
                 total = int(to_be or total)
-            self.signals.progress.emit(file_label, done, total)
+            now = time.monotonic_ns()
+            if now - last_emit >= PROGRESS_EMIT_INTERVAL_NS:
+                last_emit = now
+                self.signals.progress.emit(file_label, done, total)
 
         self.signals.log.emit(f"{file_label} <- {local_path}")
-        client.upload(local_path, remote_path, progress_cb=cb)
+        client.upload(local_path, remote_path, progress_cb=cb, size=total)
         self.signals.progress.emit(file_label, total, total)
 
 
@@ -1466,11 +2266,28 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stop_event = threading.Event()
         self.running_ids: set[str] = set()
 
+        # separate from self.pool, whose threads may all be held by monitoring jobs
+        self._housekeeping_pool = QtCore.QThreadPool(self)
+        self._housekeeping_pool.setMaxThreadCount(1)
+
         self.scheduler = QtCore.QTimer(self)
         self.scheduler.setInterval(1000)
         self.scheduler.timeout.connect(self._scheduler_tick)
         self.scheduler.start()
 
+        # Config writes are coalesced: rapid edits restart the timer and hit disk once.
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._do_save)
+
+        # Log lines are buffered and appended in one block; bounded like the log box itself.
+        self._log_buffer: deque[str] = deque(maxlen=8000)
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+
         self._build_ui()
         self._build_actions()
         self._build_menu()
@@ -1868,16 +2685,34 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def closeEvent(self, event):
-        save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+        self._save_timer.stop()
+        self._do_save()
+        # nothing here waits: running jobs see stop_event and wind down on their
+        # own, and QUIT to the idle clients goes out on the housekeeping thread
         self.stop_all()
+        stale = take_expired_clients(max_idle=0)
+        if stale:
+            self._housekeeping_pool.start(_CloseClientsTask(stale))
         event.accept()
 
+    def _do_save(self):
+        save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+
     def log(self, msg: str):
-        self.log_box.appendPlainText(msg)
+        self._log_buffer.append(msg)
+        # not restarted while pending: a steady stream still flushes every 100 ms
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        self.log_box.appendPlainText("\n".join(self._log_buffer))
+        self._log_buffer.clear()
 
     def _set_concurrency(self, v: int):
         self.pool.setMaxThreadCount(int(v))
-        save_config(self.servers, self.jobs, self.groups, int(v))
+        self._save_timer.start()
 
     def _make_group_card_widget(self, g: JobGroup, selected: bool = False) -> QtWidgets.QWidget:
         frame = QtWidgets.QFrame()
@@ -2036,6 +2871,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
     # Scheduler
     def _scheduler_tick(self):
+        stale = take_expired_clients()
+        if stale:
+            self._housekeeping_pool.start(_CloseClientsTask(stale))
         now = datetime.now()
         for j in self.jobs:
             if not j.enabled:
@@ -2057,7 +2895,7 @@ class MainWindow(QtWidgets.QMainWindow):
                         g.schedule_mode = "manual"
                     else:
                         j.schedule_mode = "manual"
-                    save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+                    self._save_timer.start()
                     self._refresh_groups()
                     self._refresh_jobs()
             elif mode == "daily":
@@ -2082,10 +2920,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_stop_all.setEnabled(True)
         self.act_stop_all.setEnabled(True)
         started = 0
+        server_by_name = {s.name: s for s in self.servers}
         for j in jobs:
             if j.id in self.running_ids:
                 continue
-            prof = next((s for s in self.servers if s.name == j.server_name), None)
+            prof = server_by_name.get(j.server_name)
             if not prof:
                 self.log(f"[ERROR] Server not found: {j.server_name} (job {j.remote_dir})")
                 self.job_state[j.id] = "error"
@@ -2199,7 +3038,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             self.servers.append(s)
             self._refresh_servers()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def edit_server(self):
         idx = self.server_list.currentRow()
@@ -2222,7 +3061,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     j.server_name = s.name
             self._refresh_servers()
             self._refresh_jobs()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def del_server(self):
         idx = self.server_list.currentRow()
@@ -2235,7 +3074,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.jobs = [j for j in self.jobs if j.server_name != name]
         self._refresh_servers()
         self._refresh_jobs()
-        save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+        self._save_timer.start()
 
     def test_connect(self):
         idx = self.server_list.currentRow()
@@ -2264,7 +3103,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.groups.append(g)
             self._refresh_groups()
             self._refresh_jobs()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def edit_group(self):
         idx = self.group_list.currentRow()
@@ -2288,7 +3127,7 @@ class MainWindow(QtWidgets.QMainWindow):
             ensure_default_group(self.groups)
             self._refresh_groups()
             self._refresh_jobs()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def del_group(self):
         idx = self.group_list.currentRow()
@@ -2307,7 +3146,7 @@ class MainWindow(QtWidgets.QMainWindow):
         ensure_default_group(self.groups)
         self._refresh_groups()
         self._refresh_jobs()
-        save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+        self._save_timer.start()
 
     # Jobs
     def add_job(self):
@@ -2324,7 +3163,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 j.id = str(uuid.uuid4())
             self.jobs.append(j)
             self._refresh_jobs()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def edit_job(self):
         row = self._selected_job_row()
@@ -2346,7 +3185,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.jobs[i] = j
                     break
             self._refresh_jobs()
-            save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+            self._save_timer.start()
 
     def del_job(self):
         row = self._selected_job_row()
@@ -2363,7 +3202,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.job_state.pop(cur.id, None)
         self.running_ids.discard(cur.id)
         self._refresh_jobs()
-        save_config(self.servers, self.jobs, self.groups, int(self.conc_spin.value()))
+        self._save_timer.start()
 
 
 
@@ -0,0 +1,107 @@
+import calendar
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from ftpsync import ftp_sync_gui_v3 as v3  # noqa: E402
+
+
+def _utc(*args) -> int:
+    return calendar.timegm(args + (0,) * (6 - len(args)))
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin 'now' to 2026-03-10 12:00 UTC for the year-less Unix stamps."""
+    now = _utc(2026, 3, 10, 12, 0)
+    real_gmtime = time.gmtime
+    monkeypatch.setattr(v3.time, "time", lambda: float(now))
+    monkeypatch.setattr(v3.time, "gmtime", lambda secs=None: real_gmtime(now if secs is None else secs))
+    return now
+
+
+def test_unix_recent_entry_has_minute_precision(frozen_now):
+    is_dir, size, mtime, name, precision = v3.parse_list_line(
+        "-rw-r--r--   1 ftp ftp    1234 Mar  5 10:07 survey.sgy"
+    )
+    assert (is_dir, size, name) == (False, 1234, "survey.sgy")
+    assert mtime == _utc(2026, 3, 5, 10, 7)
+    assert precision == 60
+
+
+def test_unix_old_entry_has_day_precision():
+    is_dir, size, mtime, name, precision = v3.parse_list_line(
+        "-rw-r--r--   1 ftp ftp    99 Jan  5  2023 old.txt"
+    )
+    assert mtime == _utc(2023, 1, 5)
+    assert precision == 86400
+
+
+def test_unix_future_stamp_rolls_back_a_year(frozen_now):
+    # "Dec 30" seen in March can only be last December
+    _, _, mtime, _, _ = v3.parse_list_line("-rw-r--r--   1 ftp ftp  1 Dec 30 23:59 a")
+    assert mtime == _utc(2025, 12, 30, 23, 59)
+
+
+def test_unix_dir_and_symlink():
+    assert v3.parse_list_line("drwxr-xr-x   2 ftp ftp  4096 Jan  5  2023 raw")[:2] == (True, None)
+    is_dir, _, _, name, _ = v3.parse_list_line("lrwxrwxrwx   1 ftp ftp  7 Jan  5  2023 link -> target")
+    assert (is_dir, name) == (None, "link")
+
+
+def test_month_names_do_not_depend_on_locale():
+    # parsed from a fixed table, whatever LC_TIME the GUI process runs with
+    _, _, mtime, _, _ = v3.parse_list_line("-rw-r--r--   1 ftp ftp  1 SEP  1  2024 a")
+    assert mtime == _utc(2024, 9, 1)
+
+
+def test_dos_entries():
+    assert v3.parse_list_line("01-05-23  01:30PM       1234 c.txt") == (
+        False, 1234, _utc(2023, 1, 5, 13, 30), "c.txt", 60,
+    )
+    assert v3.parse_list_line("01-05-2023  12:10AM  <DIR> d") == (
+        True, None, _utc(2023, 1, 5, 0, 10), "d", 60,
+    )
+    # 12PM is noon, two-digit years >= 69 are 19xx like strptime's %y
+    assert v3.parse_list_line("07-20-69  12:00PM  1 moon")[2] == _utc(1969, 7, 20, 12, 0)
+
+
+def test_tz_offset_is_added():
+    line = "-rw-r--r--   1 ftp ftp  1 Jan  5  2023 a"
+    assert v3.parse_list_line(line, tz_offset_min=-90)[2] == _utc(2023, 1, 5) - 90 * 60
+    assert v3.parse_list_line("01-05-23  01:30PM  1 c", tz_offset_min=60)[2] == _utc(2023, 1, 5, 14, 30)
+
+
+def test_unparseable_lines():
+    assert v3.parse_list_line("total 42") is None
+    # a bad date keeps the entry but drops its time
+    assert v3.parse_list_line("-rw-r--r--   1 ftp ftp  1 Foo  5  2023 a")[2] is None
+
+
+def test_upload_compares_at_list_precision():
+    day = _utc(2023, 1, 5)
+    remote = v3.RemoteEntry(name="a", is_dir=False, size=10, mtime=day, mtime_precision=86400)
+    # same size, local stamp inside the remote's day: unchanged
+    assert not v3.should_upload((10, day + 3600), remote)
+    assert v3.should_upload((10, day + 86400 + 2), remote)
+    exact = v3.RemoteEntry(name="a", is_dir=False, size=10, mtime=day)
+    assert v3.should_upload((10, day + 3600), exact)
+
+
+def test_download_is_not_triggered_by_truncated_stamp():
+    minute = _utc(2026, 3, 5, 10, 7)
+    remote = v3.RemoteEntry(name="a", is_dir=False, size=10, mtime=minute, mtime_precision=60)
+    assert not v3.should_transfer(remote, (10, minute + 30))
+    assert v3.should_transfer(remote, (10, minute - 120))
+
+
+@pytest.mark.parametrize("value", ["20260305100759", "20260305100759.123", " 20260305100759.5 "])
+def test_mdtm_time_ignores_fractional_seconds(value):
+    assert v3._ftp_time_to_epoch(value) == _utc(2026, 3, 5, 10, 7, 59)
+
+
+@pytest.mark.parametrize("value", [None, "", "2026030510", "2026-03-05 10:07", "20261305100759"])
+def test_mdtm_time_rejects_bad_values(value):
+    assert v3._ftp_time_to_epoch(value) is None
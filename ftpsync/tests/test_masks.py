@@ -0,0 +1,38 @@
+import fnmatch
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from ftpsync import ftp_sync_gui_v3 as v3  # noqa: E402
+
+
+NAMES = ["line_01.sgy", "LINE_02.SGY", "line_01.sgy.bak", "notes.txt", "README", "a.b.c", ".hidden"]
+
+
+@pytest.mark.parametrize("mask, expected", [
+    ("*.sgy", ("", "*.sgy")),
+    ("raw/2024/*.sgy", ("raw/2024", "*.sgy")),
+    ("/raw//day?.txt", ("raw", "day?.txt")),
+    ("raw/*/line.sgy", ("", "raw/*/line.sgy")),
+    ("raw/[ab]/*.txt", ("", "raw/[ab]/*.txt")),
+])
+def test_split_mask(mask, expected):
+    assert v3.split_mask(mask) == expected
+
+
+def test_star_matches_everything():
+    assert v3.compile_mask("*") is None
+
+
+def test_star_dot_star_needs_a_dot():
+    match = v3.compile_mask("*.*")
+    assert match("a.b")
+    assert not match("README")
+
+
+@pytest.mark.parametrize("mask", ["*.sgy", "*.SGY", "*.*", "line_??.s[eg]y", "*_0[1-2].*", "a*b*c", "*.sgy.bak"])
+def test_compile_mask_agrees_with_fnmatch(mask):
+    match = v3.compile_mask(mask)
+    for name in NAMES:
+        assert bool(match(name)) == fnmatch.fnmatch(name, mask), (mask, name)
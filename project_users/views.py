@@ -1,3 +1,5 @@
+from functools import wraps
+
 from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
@@ -12,13 +14,25 @@ User = get_user_model()
 
 
 def _get_active_project_or_redirect(request):
+    if hasattr(request, "_cached_active_project"):
+        return request._cached_active_project
     try:
         project = request.user.settings.active_project
     except Exception:
         project = None
-    if not project:
-        return None
-    return project
+    request._cached_active_project = project or None
+    return request._cached_active_project
+
+
+def _members_for(project):
+    # only the columns members.html renders; skips the rest of the user row
+    return (
+        ProjectMember.objects
+        .filter(project=project)
+        .select_related("user")
+        .only("id", "can_edit", "user__id", "user__username", "user__email", "user__is_active")
+        .order_by("user__username")
+    )
 
 
 def _owner_required(request, project):
@@ -27,25 +41,34 @@ def _owner_required(request, project):
         raise PermissionDenied()
 
 
-@login_required
-def members_page(request):
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")  # <-- your project selector/list url name
+def require_owner_on_active_project(view):
+    """
+    Resolve the active project once, check access, and pass it to the view.
+    Superuser/owner always pass can_view without a query, so the membership
+    lookup is only made for staff; everyone else fails the owner check first.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        project = _get_active_project_or_redirect(request)
+        if not project:
+            messages.warning(request, "Select an active project first.")
+            return redirect("project_list")  # <-- your project selector/list url name
 
-    # must at least be able to view
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
+        _owner_required(request, project)
 
-    _owner_required(request, project)
+        if not getattr(request, "_can_view", False):
+            request._can_view = project.can_view(request.user)
+        if not request._can_view:
+            raise PermissionDenied("No access to this project.")
+
+        return view(request, project, *args, **kwargs)
+    return wrapper
 
-    members = (
-        ProjectMember.objects
-        .filter(project=project)
-        .select_related("user")
-        .order_by("user__username")
-    )
+
+@login_required
+@require_owner_on_active_project
+def members_page(request, project):
+    members = _members_for(project)
 
     add_form = AddMemberForm()
     create_form = CreateUserForm()
@@ -60,23 +83,14 @@ def members_page(request):
 
 @login_required
 @transaction.atomic
-def create_user(request):
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")
-
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
-
-    _owner_required(request, project)
-
+@require_owner_on_active_project
+def create_user(request, project):
     if request.method != "POST":
         return redirect("project_users_members")
 
     form = CreateUserForm(request.POST)
     if not form.is_valid():
-        members = ProjectMember.objects.filter(project=project).select_related("user")
+        members = _members_for(project)
         return render(request, "project_users/members.html", {
             "project": project,
             "members": members,
@@ -97,10 +111,9 @@ def create_user(request):
     u.save()
 
     # optionally auto-add created user to this project as view-only
-    ProjectMember.objects.get_or_create(
-        project=project,
-        user=u,
-        defaults={"can_edit": False},
+    ProjectMember.objects.bulk_create(
+        [ProjectMember(project=project, user=u, can_edit=False)],
+        ignore_conflicts=True,
     )
 
     messages.success(request, f"User '{u.username}' created and added to project.")
@@ -109,23 +122,14 @@ def create_user(request):
 
 @login_required
 @transaction.atomic
-def add_member(request):
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")
-
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
-
-    _owner_required(request, project)
-
+@require_owner_on_active_project
+def add_member(request, project):
     if request.method != "POST":
         return redirect("project_users_members")
 
     form = AddMemberForm(request.POST)
     if not form.is_valid():
-        members = ProjectMember.objects.filter(project=project).select_related("user")
+        members = _members_for(project)
         return render(request, "project_users/members.html", {
             "project": project,
             "members": members,
@@ -140,10 +144,12 @@ def add_member(request):
 
     can_edit = bool(form.cleaned_data.get("can_edit"))
 
-    ProjectMember.objects.update_or_create(
-        project=project,
-        user=u,
-        defaults={"can_edit": can_edit},
+    # single INSERT ... ON CONFLICT DO UPDATE on the (project, user) unique pair
+    ProjectMember.objects.bulk_create(
+        [ProjectMember(project=project, user=u, can_edit=can_edit)],
+        update_conflicts=True,
+        unique_fields=["project", "user"],
+        update_fields=["can_edit"],
     )
 
     messages.success(request, f"User '{u.username}' added/updated.")
@@ -152,17 +158,8 @@ def add_member(request):
 
 @login_required
 @transaction.atomic
-def update_member(request, member_id):
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")
-
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
-
-    _owner_required(request, project)
-
+@require_owner_on_active_project
+def update_member(request, project, member_id):
     member = ProjectMember.objects.select_related("user").filter(id=member_id, project=project).first()
     if not member:
         raise PermissionDenied("Member not found.")
@@ -184,17 +181,8 @@ def update_member(request, member_id):
 
 @login_required
 @transaction.atomic
-def remove_member(request, member_id):
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")
-
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
-
-    _owner_required(request, project)
-
+@require_owner_on_active_project
+def remove_member(request, project, member_id):
     member = ProjectMember.objects.select_related("user").filter(id=member_id, project=project).first()
     if not member:
         raise PermissionDenied("Member not found.")
@@ -210,21 +198,12 @@ def remove_member(request, member_id):
 
 @login_required
 @transaction.atomic
-def toggle_user_active(request, user_id):
+@require_owner_on_active_project
+def toggle_user_active(request, project, user_id):
     """
     This changes GLOBAL user status (is_active). Use carefully.
     Owner/staff can deactivate/reactivate user accounts.
     """
-    project = _get_active_project_or_redirect(request)
-    if not project:
-        messages.warning(request, "Select an active project first.")
-        return redirect("project_list")
-
-    if not project.can_view(request.user):
-        raise PermissionDenied("No access to this project.")
-
-    _owner_required(request, project)
-
     if request.method != "POST":
         return redirect("project_users_members")
 
@@ -1,5 +1,6 @@
 import math
 import sqlite3
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -22,17 +23,39 @@ from bokeh.transform import linear_cmap, dodge
 class BlackBoxGraphics(object):
     """Bokeh Graphical functions for BlackBox Logs (SeisWebLog)"""
 
+    # load_bbox_data coerces these to numbers (config *Name columns excluded)
+    _NUMERIC_PREFIXES = ("GNSS", "ROV", "Vessel", "Depth")
+
     def __init__(self, db_path):
         self.db_path = Path(db_path)
         self._bbox_cache: dict[tuple, pd.DataFrame] = {}
+        self._cfg_names_cache: dict[str, dict | None] = {}
         self.dsr_df=None
+        # one read-only connection per thread, opened on first use
+        self._local = threading.local()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
+        """
+        Cached read-only connection for the calling thread.
+        `with self._connect() as conn:` only ends the transaction, it does not close it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON;")
+            conn.execute("PRAGMA mmap_size = 268435456;")
+            conn.execute("PRAGMA cache_size = -65536;")
+            self._local.conn = conn
         return conn
 
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     # ---------------------------------------------------------------------
     # Shared loading + caching
     # ---------------------------------------------------------------------
@@ -48,6 +71,9 @@ class BlackBoxGraphics(object):
     def clear_bbox_cache(self):
         self._bbox_cache.clear()
 
+    def clear_cfg_cache(self):
+        self._cfg_names_cache.clear()
+
     def load_bbox_data(
         self,
         # selection
@@ -60,8 +86,12 @@ class BlackBoxGraphics(object):
         end_ts: str | None = None,
         # what to load
         columns: list[str] | None = None,
+        # extra SQL filters, e.g. ["bb.ROV1_Depth1 BETWEEN ? AND ?"] with where_params=[-2000, -100]
+        where_exprs: list[str] | None = None,
+        where_params: list | None = None,
         use_cache: bool = True,
         force_reload: bool = False,
+        chunksize: int | None = 100_000,
     ) -> pd.DataFrame:
         """
         Load BlackBox rows once and reuse across many plots.
@@ -70,12 +100,20 @@ class BlackBoxGraphics(object):
           - You can pass file_name OR file_names OR file_ids.
           - Returned dataframe includes 'T' datetime if requested as `bb.TimeStamp AS T`.
           - If `columns` is None, a "common package" (GNSS + ROV + config names) is loaded.
+          - `where_exprs`/`where_params` are ANDed into the WHERE clause so SQLite drops rows
+            before they reach pandas.
+          - Rows are read `chunksize` at a time to bound the parser's scratch memory;
+            pass None to read in one go.
         """
 
         if file_names is None:
             file_names = []
         if file_ids is None:
             file_ids = []
+        if where_exprs is None:
+            where_exprs = []
+        if where_params is None:
+            where_params = []
         if file_name:
             file_names = list(file_names) + [file_name]
 
@@ -122,33 +160,30 @@ class BlackBoxGraphics(object):
             start_ts=start_ts,
             end_ts=end_ts,
             columns=tuple(columns),
+            where_exprs=tuple(where_exprs),
+            where_params=tuple(where_params),
         )
 
+        # cached frames are handed out as shallow copies: column arrays are shared, so callers
+        # must replace columns (df[c] = ...) rather than write into them (df.loc[m, c] = ...)
         if use_cache and not force_reload and cache_key in self._bbox_cache:
-            return self._bbox_cache[cache_key].copy()
-
-        # file_names -> file_ids
-        if file_names:
-            placeholders = ",".join("?" for _ in file_names)
-            q = f"SELECT ID, Config_FK, FileName FROM BlackBox_Files WHERE FileName IN ({placeholders})"
-            with self._connect() as conn:
-                rows = conn.execute(q, tuple(file_names)).fetchall()
+            return self._bbox_cache[cache_key].copy(deep=False)
 
-            found = {r["FileName"]: int(r["ID"]) for r in rows} if rows else {}
-            missing = [fn for fn in file_names if fn not in found]
-            if missing:
-                raise ValueError(f"BlackBox_Files: FileName not found: {missing}")
-
-            file_ids = list(set(list(file_ids) + list(found.values())))
-
-        # WHERE
+        # WHERE (file names are matched in the main query, no separate ID lookup)
         where = ["bb.TimeStamp IS NOT NULL"]
         params: list = []
 
+        file_filters = []
         if file_ids:
             placeholders = ",".join("?" for _ in file_ids)
-            where.append(f"bb.File_FK IN ({placeholders})")
+            file_filters.append(f"bb.File_FK IN ({placeholders})")
             params.extend(file_ids)
+        if file_names:
+            placeholders = ",".join("?" for _ in file_names)
+            file_filters.append(f"bf.FileName IN ({placeholders})")
+            params.extend(file_names)
+        if file_filters:
+            where.append(f"({' OR '.join(file_filters)})")
 
         if config_fk is not None:
             where.append("bf.Config_FK = ?")
@@ -166,6 +201,9 @@ class BlackBoxGraphics(object):
             where.append("bb.TimeStamp <= ?")
             params.append(end_ts)
 
+        where.extend(where_exprs)
+        params.extend(where_params)
+
         sql = f"""
             SELECT
                 {", ".join(columns)}
@@ -177,15 +215,44 @@ class BlackBoxGraphics(object):
         """
 
         with self._connect() as conn:
-            df = pd.read_sql_query(sql, conn, params=tuple(params))
+            if chunksize:
+                df = pd.concat(
+                    pd.read_sql_query(sql, conn, params=tuple(params), chunksize=int(chunksize)),
+                    ignore_index=True,
+                )
+            else:
+                df = pd.read_sql_query(sql, conn, params=tuple(params))
+
+        # names that produced rows certainly exist; only the rest are checked against the DB
+        if file_names:
+            seen = set(df["FileName"].unique()) if "FileName" in df.columns else set()
+            unseen = [fn for fn in file_names if fn not in seen]
+            if unseen:
+                placeholders = ",".join("?" for _ in unseen)
+                q = f"SELECT FileName FROM BlackBox_Files WHERE FileName IN ({placeholders})"
+                with self._connect() as conn:
+                    found = {r["FileName"] for r in conn.execute(q, tuple(unseen)).fetchall()}
+                missing = [fn for fn in unseen if fn not in found]
+                if missing:
+                    raise ValueError(f"BlackBox_Files: FileName not found: {missing}")
 
         # normalize timestamps if present
         if "T" in df.columns:
             df["T"] = pd.to_datetime(df["T"], errors="coerce")
             df = df.dropna(subset=["T"])
 
+        # numeric sensor columns once here, so plots can skip their own to_numeric passes;
+        # REAL columns already arrive as float64, only text-polluted ones (object) need parsing
+        num_cols = [
+            c for c in df.columns
+            if c.startswith(self._NUMERIC_PREFIXES) and not c.endswith("Name") and df[c].dtype == object
+        ]
+        if num_cols:
+            df[num_cols] = df[num_cols].apply(pd.to_numeric, errors="coerce")
+
         if use_cache:
-            self._bbox_cache[cache_key] = df.copy()
+            self._bbox_cache[cache_key] = df
+            return df.copy(deep=False)
 
         return df
 
@@ -213,28 +280,65 @@ class BlackBoxGraphics(object):
             WHERE bf.FileName = ?
             LIMIT 1
         """
-        with self._connect() as conn:
-            row = conn.execute(sql, (file_name,)).fetchone()
-        if not row:
+        if file_name not in self._cfg_names_cache:
+            with self._connect() as conn:
+                row = conn.execute(sql, (file_name,)).fetchone()
+            # None remembers "not found" so repeated misses don't re-query either
+            self._cfg_names_cache[file_name] = dict(row) if row else None
+        cfg = self._cfg_names_cache[file_name]
+        if cfg is None:
             raise ValueError(f"BlackBox_Files: FileName not found: {file_name}")
-        return dict(row)
-
-    def _qc_diffage(self, v, diff_good_max: float, diff_warn_max: float) -> str:
-        if pd.isna(v):
-            return "no"
-        if v <= diff_good_max:
-            return "good"
-        if v <= diff_warn_max:
-            return "warn"
-        return "bad"
-
-    def _qc_color(self, st: str) -> str:
+        return dict(cfg)
+
+    def _qc_diffage_colors(self, v: pd.Series, diff_good_max: float, diff_warn_max: float) -> np.ndarray:
+        """DiffAge -> QC color per row: gray=no data, green=good, orange=warn, red=bad."""
+        a = v.to_numpy(dtype=float, na_value=np.nan)
+        return np.select(
+            [np.isnan(a), a <= diff_good_max, a <= diff_warn_max],
+            ["#9e9e9e", "#2ca02c", "#ff7f0e"],
+            default="#d62728",
+        )
+
+    # label key -> (column in load_bbox_data frames, column in BBox_Configs_List, fallback)
+    _LABEL_SOURCES = {
+        "rov1": ("Rov1Name", "rov1_name", "ROV1"),
+        "rov2": ("Rov2Name", "rov2_name", "ROV2"),
+        "gnss1": ("Gnss1Name", "gnss1_name", "GNSS1"),
+        "gnss2": ("Gnss2Name", "gnss2_name", "GNSS2"),
+        "depth1": ("Depth1Name", "Depth1_name", "Depth1"),
+        "depth2": ("Depth2Name", "Depth2_name", "Depth2"),
+        "vessel": ("VesselName", "Vessel_name", "Vessel"),
+    }
+
+    def _first_nonnull(self, df: pd.DataFrame, col_name: str, fallback: str) -> str:
+        if col_name not in df.columns:
+            return fallback
+        # first_valid_index stops at the first hit instead of copying the non-null subset
+        idx = df[col_name].first_valid_index()
+        if idx is None:
+            return fallback
+        s = str(df[col_name].loc[idx]).strip()
+        return s if s else fallback
+
+    def _labels_for(self, source: pd.DataFrame | str) -> dict:
+        """
+        Display names for rov1/rov2/gnss1/gnss2/depth1/depth2/vessel, taken from the
+        config name columns of a loaded frame, or from the config of a BlackBox file name.
+        """
+        if isinstance(source, pd.DataFrame):
+            return {
+                key: self._first_nonnull(source, df_col, fallback)
+                for key, (df_col, _, fallback) in self._LABEL_SOURCES.items()
+            }
+        try:
+            cfg = self.get_bbox_config_names_by_filename(source)
+        except Exception:
+            # labels are cosmetic: an unknown file or DB hiccup just means default names
+            cfg = {}
         return {
-            "good": "#2ca02c",  # green
-            "warn": "#ff7f0e",  # orange
-            "bad": "#d62728",   # red
-            "no": "#9e9e9e",    # gray
-        }.get(st, "#9e9e9e")
+            key: (str(cfg.get(cfg_col) or "").strip() or fallback)
+            for key, (_, cfg_col, fallback) in self._LABEL_SOURCES.items()
+        }
 
     # ---------------------------------------------------------------------
     # Plots
@@ -277,14 +381,9 @@ class BlackBoxGraphics(object):
             single_file = file_names[0]
 
         if single_file:
-            try:
-                cfg = self.get_bbox_config_names_by_filename(single_file)
-                if cfg.get("gnss1_name"):
-                    _gnss1 = cfg["gnss1_name"]
-                if cfg.get("gnss2_name"):
-                    _gnss2 = cfg["gnss2_name"]
-            except Exception:
-                pass
+            labels = self._labels_for(single_file)
+            _gnss1 = labels["gnss1"]
+            _gnss2 = labels["gnss2"]
 
         if gnss1_label:
             _gnss1 = gnss1_label
@@ -308,7 +407,7 @@ class BlackBoxGraphics(object):
                 ],
             )
         else:
-            df = data.copy()
+            df = data.copy(deep=False)
 
         if df.empty:
             p = figure(title=f"{title} (no data)", sizing_mode="stretch_both")
@@ -316,44 +415,29 @@ class BlackBoxGraphics(object):
                 show(p)
             return p
 
-        # ---------- normalize numeric ----------
-        for c in ["GNSS1_NOS", "GNSS1_DiffAge", "GNSS1_FixQuality",
-                  "GNSS2_NOS", "GNSS2_DiffAge", "GNSS2_FixQuality"]:
+        # numeric dtypes come from load_bbox_data
+        # NOS >= 0 (columns are replaced, never written in place: df may share cached arrays)
+        for c in ("GNSS1_NOS", "GNSS2_NOS"):
             if c in df.columns:
-                df[c] = pd.to_numeric(df[c], errors="coerce")
-
-        # NOS >= 0
-        if "GNSS1_NOS" in df.columns:
-            df.loc[df["GNSS1_NOS"] < 0, "GNSS1_NOS"] = np.nan
-        if "GNSS2_NOS" in df.columns:
-            df.loc[df["GNSS2_NOS"] < 0, "GNSS2_NOS"] = np.nan
+                df[c] = df[c].mask(df[c] < 0)
 
         # FixQuality in 0..9
         for c in ("GNSS1_FixQuality", "GNSS2_FixQuality"):
             if c in df.columns:
-                df.loc[(df[c].notna()) & ((df[c] < 0) | (df[c] > 9)), c] = np.nan
+                df[c] = df[c].mask((df[c] < 0) | (df[c] > 9))
 
         # DiffAge sane
         for c in ("GNSS1_DiffAge", "GNSS2_DiffAge"):
             if c in df.columns:
-                df.loc[(df[c].notna()) & (df[c] < 0), c] = np.nan
-                df.loc[(df[c].notna()) & (df[c] > 9999), c] = np.nan
+                df[c] = df[c].mask((df[c] < 0) | (df[c] > 9999))
 
         # ---------- DiffAge QC colors ----------
         if "GNSS1_DiffAge" in df.columns:
-            df["GNSS1_DA_Color"] = (
-                df["GNSS1_DiffAge"]
-                .apply(lambda v: self._qc_diffage(v, diff_good_max, diff_warn_max))
-                .apply(self._qc_color)
-            )
+            df["GNSS1_DA_Color"] = self._qc_diffage_colors(df["GNSS1_DiffAge"], diff_good_max, diff_warn_max)
             df["GNSS1_DiffAgePlot"] = df["GNSS1_DiffAge"].clip(lower=0, upper=diff_warn_max * 3)
 
         if "GNSS2_DiffAge" in df.columns:
-            df["GNSS2_DA_Color"] = (
-                df["GNSS2_DiffAge"]
-                .apply(lambda v: self._qc_diffage(v, diff_good_max, diff_warn_max))
-                .apply(self._qc_color)
-            )
+            df["GNSS2_DA_Color"] = self._qc_diffage_colors(df["GNSS2_DiffAge"], diff_good_max, diff_warn_max)
             df["GNSS2_DiffAgePlot"] = df["GNSS2_DiffAge"].clip(lower=0, upper=diff_warn_max * 3)
 
         src = ColumnDataSource(df)
@@ -483,35 +567,46 @@ class BlackBoxGraphics(object):
                 columns=[
                     "bb.ROV1_Depth1 AS Depth1",
                     "bb.ROV1_Depth2 AS Depth2",
+                    "(bb.ROV1_Depth2 - bb.ROV1_Depth1) AS DepthDiff",
                 ],
+                # range + diff filters run in SQLite (BETWEEN/ABS are false for NULLs)
+                where_exprs=[
+                    "bb.ROV1_Depth1 BETWEEN ? AND ?",
+                    "bb.ROV1_Depth2 BETWEEN ? AND ?",
+                    "ABS(bb.ROV1_Depth2 - bb.ROV1_Depth1) <= ?",
+                ],
+                where_params=[depth_min, depth_max, depth_min, depth_max, diff_abs_max],
             )
+            if df.empty:
+                p = figure(title=f"{title} (no data in range)", sizing_mode="stretch_both")
+                if is_show:
+                    show(p)
+                return p
         else:
-            df = data.copy()
+            df = data.copy(deep=False)
 
-        if df.empty or "Depth1" not in df.columns or "Depth2" not in df.columns:
-            p = figure(title=f"{title} (no data)", sizing_mode="stretch_both")
-            if is_show:
-                show(p)
-            return p
+            if df.empty or "Depth1" not in df.columns or "Depth2" not in df.columns:
+                p = figure(title=f"{title} (no data)", sizing_mode="stretch_both")
+                if is_show:
+                    show(p)
+                return p
 
-        df["Depth1"] = pd.to_numeric(df["Depth1"], errors="coerce")
-        df["Depth2"] = pd.to_numeric(df["Depth2"], errors="coerce")
-        df = df.dropna(subset=["Depth1", "Depth2"])
+            df = df.dropna(subset=["Depth1", "Depth2"])
 
-        df = df[(df["Depth1"].between(depth_min, depth_max)) & (df["Depth2"].between(depth_min, depth_max))]
-        if df.empty:
-            p = figure(title=f"{title} (no data in range)", sizing_mode="stretch_both")
-            if is_show:
-                show(p)
-            return p
+            df = df[(df["Depth1"].between(depth_min, depth_max)) & (df["Depth2"].between(depth_min, depth_max))]
+            if df.empty:
+                p = figure(title=f"{title} (no data in range)", sizing_mode="stretch_both")
+                if is_show:
+                    show(p)
+                return p
 
-        df["DepthDiff"] = df["Depth2"] - df["Depth1"]
-        df = df[df["DepthDiff"].abs() <= diff_abs_max]
-        if df.empty:
-            p = figure(title=f"{title} (no data after diff filter)", sizing_mode="stretch_both")
-            if is_show:
-                show(p)
-            return p
+            df["DepthDiff"] = df["Depth2"] - df["Depth1"]
+            df = df[df["DepthDiff"].abs() <= diff_abs_max]
+            if df.empty:
+                p = figure(title=f"{title} (no data after diff filter)", sizing_mode="stretch_both")
+                if is_show:
+                    show(p)
+                return p
 
         x = df["Depth1"].to_numpy()
         y = df["DepthDiff"].to_numpy()
@@ -520,27 +615,23 @@ class BlackBoxGraphics(object):
         H, xedges, yedges = np.histogram2d(x, y, bins=[bins_x, bins_y])
         H = H.T
 
-        # Flatten into rects
-        xs = []
-        ys = []
-        counts = []
-        for i in range(len(xedges) - 1):
-            for j in range(len(yedges) - 1):
-                c = H[j, i]
-                if c <= 0:
-                    continue
-                xs.append((xedges[i] + xedges[i + 1]) / 2)
-                ys.append((yedges[j] + yedges[j + 1]) / 2)
-                counts.append(c)
-
-        if not counts:
+        # Flatten into rects (non-empty bins only)
+        xc = (xedges[:-1] + xedges[1:]) / 2
+        yc = (yedges[:-1] + yedges[1:]) / 2
+        XX, YY = np.meshgrid(xc, yc)
+        mask = H > 0
+        xs = XX[mask]
+        ys = YY[mask]
+        counts = H[mask]
+
+        if not counts.size:
             p = figure(title=f"{title} (no bins with counts)", sizing_mode="stretch_both")
             if is_show:
                 show(p)
             return p
 
         src = ColumnDataSource(dict(x=xs, y=ys, count=counts))
-        mapper = linear_cmap(field_name="count", palette=Viridis256, low=min(counts), high=max(counts))
+        mapper = linear_cmap(field_name="count", palette=Viridis256, low=float(counts.min()), high=float(counts.max()))
 
         p = figure(
             title=title,
@@ -607,17 +698,21 @@ class BlackBoxGraphics(object):
                     "bb.ROV2_Depth1 AS ROV2_Depth1",
                     "bb.ROV2_Depth2 AS ROV2_Depth2",
                 ],
+                # drop rows where neither ROV has both sensors in range; _build still splits per ROV
+                where_exprs=[
+                    "((bb.ROV1_Depth1 BETWEEN ? AND ? AND bb.ROV1_Depth2 BETWEEN ? AND ?)"
+                    " OR (bb.ROV2_Depth1 BETWEEN ? AND ? AND bb.ROV2_Depth2 BETWEEN ? AND ?))",
+                ],
+                where_params=[depth_min, depth_max] * 4,
             )
         else:
-            df = data.copy()
+            df = data.copy(deep=False)
 
         def _build(df_in: pd.DataFrame, a: str, b: str, label: str):
             if a not in df_in.columns or b not in df_in.columns:
                 return pd.DataFrame(columns=["Depth1", "Depth2", "DepthDiff", "ROV"])
             tmp = df_in[[a, b]].copy()
             tmp.columns = ["Depth1", "Depth2"]
-            tmp["Depth1"] = pd.to_numeric(tmp["Depth1"], errors="coerce")
-            tmp["Depth2"] = pd.to_numeric(tmp["Depth2"], errors="coerce")
             tmp = tmp.dropna(subset=["Depth1", "Depth2"])
             tmp = tmp[(tmp["Depth1"].between(depth_min, depth_max)) & (tmp["Depth2"].between(depth_min, depth_max))]
             tmp["DepthDiff"] = tmp["Depth2"] - tmp["Depth1"]
@@ -686,8 +781,6 @@ class BlackBoxGraphics(object):
 
     def _prepare(self, df: pd.DataFrame, depth_min: float, depth_max: float) -> pd.DataFrame:
         df = df.copy()
-        df["Depth1"] = pd.to_numeric(df["Depth1"], errors="coerce")
-        df["Depth2"] = pd.to_numeric(df["Depth2"], errors="coerce")
         if "T" in df.columns:
             df["T"] = pd.to_datetime(df["T"], errors="coerce")
         df = df.dropna(subset=["Depth1", "Depth2"])
@@ -735,7 +828,7 @@ class BlackBoxGraphics(object):
         if data is None:
             data = self.load_bbox_data()
 
-        df = data.copy()
+        df = data.copy(deep=False)
 
         col1 = f"ROV{rov_num}_Depth1"
         col2 = f"ROV{rov_num}_Depth2"
@@ -757,23 +850,10 @@ class BlackBoxGraphics(object):
         # ✅ Dynamic labels from config
         # =====================================================
 
-        # ROV name
-        rov_col = "Rov1Name" if rov_num == 1 else "Rov2Name"
-        if rov_col in df.columns and df[rov_col].notna().any():
-            rov_label = str(df[rov_col].dropna().iloc[0])
-        else:
-            rov_label = f"ROV{rov_num}"
-
-        # Sensor names
-        if "Depth1Name" in df.columns and df["Depth1Name"].notna().any():
-            d1_label = str(df["Depth1Name"].dropna().iloc[0])
-        else:
-            d1_label = "Depth1"
-
-        if "Depth2Name" in df.columns and df["Depth2Name"].notna().any():
-            d2_label = str(df["Depth2Name"].dropna().iloc[0])
-        else:
-            d2_label = "Depth2"
+        labels = self._labels_for(df)
+        rov_label = labels["rov1"] if rov_num == 1 else labels["rov2"]
+        d1_label = labels["depth1"]
+        d2_label = labels["depth2"]
 
         # =====================================================
         # Calculations
@@ -826,11 +906,13 @@ class BlackBoxGraphics(object):
             xs = (xedges[:-1] + xedges[1:]) / 2
             ys = (yedges[:-1] + yedges[1:]) / 2
 
-            xs_grid = np.repeat(xs, len(ys))
-            ys_grid = np.tile(ys, len(xs))
-            vals = H.T.flatten()
+            # empty bins are not drawn, so keep them out of the source
+            XX, YY = np.meshgrid(xs, ys)
+            HH = H.T
+            mask = HH > 0
+            vals = HH[mask]
 
-            hsrc = ColumnDataSource(dict(x=xs_grid, y=ys_grid, v=vals))
+            hsrc = ColumnDataSource(dict(x=XX[mask], y=YY[mask], v=vals))
 
             mapper = LinearColorMapper(
                 palette=Turbo256,
@@ -1006,17 +1088,10 @@ class BlackBoxGraphics(object):
         df.loc[m2_valid, "ROV2_D12_Diff"] = df.loc[m2_valid, "ROV2_Depth1"] - df.loc[m2_valid, "ROV2_Depth2"]
 
         # ---- labels from config (fallbacks) ----
-        def _first_nonnull(col_name: str, fallback: str) -> str:
-            if col_name in df.columns and df[col_name].notna().any():
-                v = df[col_name].dropna().iloc[0]
-                s = str(v).strip()
-                return s if s else fallback
-            return fallback
-
-        rov1_label = _first_nonnull("Rov1Name", "ROV1")
-        rov2_label = _first_nonnull("Rov2Name", "ROV2")
-        depth1_label = _first_nonnull("Depth1Name", "Depth1")
-        depth2_label = _first_nonnull("Depth2Name", "Depth2")
+        rov1_label = self._first_nonnull(df, "Rov1Name", "ROV1")
+        rov2_label = self._first_nonnull(df, "Rov2Name", "ROV2")
+        depth1_label = self._first_nonnull(df, "Depth1Name", "Depth1")
+        depth2_label = self._first_nonnull(df, "Depth2Name", "Depth2")
 
         # ---- threshold split (OK vs ERR) ----
         thr = None if diff_threshold is None else float(diff_threshold)
@@ -1250,16 +1325,9 @@ class BlackBoxGraphics(object):
         rov2_min, rov2_max, rov2_avg = _stats(df.get("ROV2_SOG"))
 
         # ---- labels ----
-        def _first_nonnull(col_name: str, fallback: str) -> str:
-            if col_name in df.columns and df[col_name].notna().any():
-                v = df[col_name].dropna().iloc[0]
-                s = str(v).strip()
-                return s if s else fallback
-            return fallback
-
-        vessel_label = _first_nonnull("VesselName", "Vessel")
-        rov1_label = _first_nonnull("Rov1Name", "ROV1")
-        rov2_label = _first_nonnull("Rov2Name", "ROV2")
+        vessel_label = self._first_nonnull(df, "VesselName", "Vessel")
+        rov1_label = self._first_nonnull(df, "Rov1Name", "ROV1")
+        rov2_label = self._first_nonnull(df, "Rov2Name", "ROV2")
 
         # ---- legend labels with stats ----
         vessel_legend = f"{vessel_label}  min:{vessel_min:.2f}  max:{vessel_max:.2f}  avg:{vessel_avg:.2f}"
@@ -1397,15 +1465,8 @@ class BlackBoxGraphics(object):
         if bins_downsample and int(bins_downsample) > 1:
             df = df.iloc[::int(bins_downsample), :].copy()
 
-        def _first_nonnull(col_name: str, fallback: str) -> str:
-            if col_name in df.columns and df[col_name].notna().any():
-                v = df[col_name].dropna().iloc[0]
-                s = str(v).strip()
-                return s if s else fallback
-            return fallback
-
-        g1 = _first_nonnull("Gnss1Name", "GNSS1")
-        g2 = _first_nonnull("Gnss2Name", "GNSS2")
+        g1 = self._first_nonnull(df, "Gnss1Name", "GNSS1")
+        g2 = self._first_nonnull(df, "Gnss2Name", "GNSS2")
 
         def _stats(series):
             s = pd.to_numeric(series, errors="coerce").dropna()
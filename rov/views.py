@@ -917,42 +917,44 @@ def bbox_file_selected(request):
             return JsonResponse({"ok": False, "error": "No file_id / file_name"}, status=400)
 
         bbgr = BlackBoxGraphics(project.db_path)
+        try:
+            # ---- 1) load file meta / labels (light query)
+            # (kept same logic as you already have)
+            file_details = bbgr.get_bbox_config_names_by_filename(file_name) if file_name else {}
 
-        # ---- 1) load file meta / labels (light query)
-        # (kept same logic as you already have)
-        file_details = bbgr.get_bbox_config_names_by_filename(file_name) if file_name else {}
-
-        # ---- 2) ONE heavy query for ALL plots
-        # Use file_name (your existing workflow uses filename)
-        data = bbgr.load_bbox_data(
-            file_name=file_name if file_name else None,
-            file_ids=[file_id] if (not file_name and file_id) else None,
-            # columns=None -> loads the shared common package for many plots
-            # you can also pass start_ts/end_ts here later if you add UI time filters
-        )
-        dsr_df = bbgr.dsr_points_in_bbox_timeframe(data)
-        # ---- 3) build plots from same dataframe
-        gnss_plot = bbgr.bokeh_gnss_qc_timeseries(
-            title="GNSS QC",
-            gnss1_label=file_details.get("gnss1_name"),
-            gnss2_label=file_details.get("gnss2_name"),
-            is_show=False,
-            data=data,
-        )
+            # ---- 2) ONE heavy query for ALL plots
+            # Use file_name (your existing workflow uses filename)
+            data = bbgr.load_bbox_data(
+                file_name=file_name if file_name else None,
+                file_ids=[file_id] if (not file_name and file_id) else None,
+                # columns=None -> loads the shared common package for many plots
+                # you can also pass start_ts/end_ts here later if you add UI time filters
+            )
+            dsr_df = bbgr.dsr_points_in_bbox_timeframe(data)
+            # ---- 3) build plots from same dataframe
+            gnss_plot = bbgr.bokeh_gnss_qc_timeseries(
+                title="GNSS QC",
+                gnss1_label=file_details.get("gnss1_name"),
+                gnss2_label=file_details.get("gnss2_name"),
+                is_show=False,
+                data=data,
+            )
 
-        rovs_depths_plot = bbgr.bokeh_bbox_depth12_diff_timeseries(df=data, diff_threshold=10, plot_kind="vbar", is_show=False)
-        vessel_sog = bbgr.bokeh_bbox_sog_timeseries(df=data,plot_kind="line",is_show=False)
-        hdop_plot = bbgr.bokeh_bbox_gnss_hdop_timeseries(df=data,is_show=False,return_json=False)
-        cog_vs_hdg_plot = bbgr.boke_cog_hdg_timeseries_all(df=data,is_show=False)
+            rovs_depths_plot = bbgr.bokeh_bbox_depth12_diff_timeseries(df=data, diff_threshold=10, plot_kind="vbar", is_show=False)
+            vessel_sog = bbgr.bokeh_bbox_sog_timeseries(df=data,plot_kind="line",is_show=False)
+            hdop_plot = bbgr.bokeh_bbox_gnss_hdop_timeseries(df=data,is_show=False,return_json=False)
+            cog_vs_hdg_plot = bbgr.boke_cog_hdg_timeseries_all(df=data,is_show=False)
 
-        return JsonResponse({
-            "ok": True,
-            "gnss_qc_plot": json_item(gnss_plot),
-            "rovs_depths_plot": json_item(rovs_depths_plot),
-            "vessel_sog": json_item(vessel_sog),
-            "hdop_plot":json_item(hdop_plot),
-            "cog_vs_hdg_plot": json_item(cog_vs_hdg_plot),
-        })
+            return JsonResponse({
+                "ok": True,
+                "gnss_qc_plot": json_item(gnss_plot),
+                "rovs_depths_plot": json_item(rovs_depths_plot),
+                "vessel_sog": json_item(vessel_sog),
+                "hdop_plot":json_item(hdop_plot),
+                "cog_vs_hdg_plot": json_item(cog_vs_hdg_plot),
+            })
+        finally:
+            bbgr.close()
 
     except Exception as e:
         return JsonResponse({"ok": False, "error": str(e)}, status=500)
@@ -1482,52 +1484,68 @@ def bbox_plot_item(request):
         if not file_id and not file_name:
             return JsonResponse({"ok": False, "error": "No file_id / file_name"}, status=400)
 
-        bbgr = BlackBoxGraphics(project.db_path)
-
-        # light meta (optional per request)
-        file_details = bbgr.get_bbox_config_names_by_filename(file_name) if file_name else {}
-
-        # ---- OPTIONAL: cache the heavy dataframe so 5 plot calls don't re-load it 5 times
-        # If you don't want cache yet, just call bbgr.load_bbox_data(...) directly.
-        cache_key = f"bbox_df:{project.id}:{file_name or file_id}"
-        data = cache.get(cache_key)
-        if data is None:
-            data = bbgr.load_bbox_data(
-                file_name=file_name if file_name else None,
-                file_ids=[file_id] if (not file_name and file_id) else None,
-            )
-            # store pickled df in cache (works well with filesystem/redis cache)
-            cache.set(cache_key, pickle.dumps(data), timeout=15 * 60)
-        else:
-            data = pickle.loads(data)
+        # ---- finished embeds are cached next to the dataframe (same key + lifetime);
+        # plot options below are fixed per plot_key, so plot_key identifies the figure
+        item_cache_key = f"bbox_item:{project.id}:{file_name or file_id}:{plot_key}"
+        item = cache.get(item_cache_key)
+        if item is not None:
+            return JsonResponse({
+                "ok": True,
+                "plot_key": plot_key,
+                "item": item,
+            })
 
-        # ---- build ONLY requested plot
-        if plot_key == "gnss_qc":
-            fig = bbgr.bokeh_gnss_qc_timeseries(
-                title="GNSS QC",
-                gnss1_label=file_details.get("gnss1_name"),
-                gnss2_label=file_details.get("gnss2_name"),
-                is_show=False,
-                data=data,
-            )
-        elif plot_key == "rovs_depths":
-            fig = bbgr.bokeh_bbox_depth12_diff_timeseries(
-                df=data, diff_threshold=10, plot_kind="vbar", is_show=False
-            )
-        elif plot_key == "vessel_sog":
-            fig = bbgr.bokeh_bbox_sog_timeseries(df=data, plot_kind="line", is_show=False)
-        elif plot_key == "hdop":
-            fig = bbgr.bokeh_bbox_gnss_hdop_timeseries(df=data, is_show=False, return_json=False)
-        elif plot_key == "cog_vs_hdg":
-            fig = bbgr.boke_cog_hdg_timeseries_all(df=data, is_show=False)
-        else:
-            return JsonResponse({"ok": False, "error": f"Unknown plot_key: {plot_key}"}, status=400)
+        bbgr = BlackBoxGraphics(project.db_path)
+        try:
+            # light meta (optional per request)
+            file_details = bbgr.get_bbox_config_names_by_filename(file_name) if file_name else {}
+
+            # ---- OPTIONAL: cache the heavy dataframe so 5 plot calls don't re-load it 5 times
+            # If you don't want cache yet, just call bbgr.load_bbox_data(...) directly.
+            cache_key = f"bbox_df:{project.id}:{file_name or file_id}"
+            data = cache.get(cache_key)
+            if data is None:
+                data = bbgr.load_bbox_data(
+                    file_name=file_name if file_name else None,
+                    file_ids=[file_id] if (not file_name and file_id) else None,
+                )
+                # store pickled df in cache (works well with filesystem/redis cache)
+                cache.set(cache_key, pickle.dumps(data), timeout=15 * 60)
+            else:
+                data = pickle.loads(data)
+
+            # ---- build ONLY requested plot
+            if plot_key == "gnss_qc":
+                fig = bbgr.bokeh_gnss_qc_timeseries(
+                    title="GNSS QC",
+                    gnss1_label=file_details.get("gnss1_name"),
+                    gnss2_label=file_details.get("gnss2_name"),
+                    is_show=False,
+                    data=data,
+                )
+            elif plot_key == "rovs_depths":
+                fig = bbgr.bokeh_bbox_depth12_diff_timeseries(
+                    df=data, diff_threshold=10, plot_kind="vbar", is_show=False
+                )
+            elif plot_key == "vessel_sog":
+                fig = bbgr.bokeh_bbox_sog_timeseries(df=data, plot_kind="line", is_show=False)
+            elif plot_key == "hdop":
+                fig = bbgr.bokeh_bbox_gnss_hdop_timeseries(df=data, is_show=False, return_json=False)
+            elif plot_key == "cog_vs_hdg":
+                fig = bbgr.boke_cog_hdg_timeseries_all(df=data, is_show=False)
+            else:
+                return JsonResponse({"ok": False, "error": f"Unknown plot_key: {plot_key}"}, status=400)
+
+            item = json_item(fig)
+            cache.set(item_cache_key, item, timeout=15 * 60)
 
-        return JsonResponse({
-            "ok": True,
-            "plot_key": plot_key,
-            "item": json_item(fig),
-        })
+            return JsonResponse({
+                "ok": True,
+                "plot_key": plot_key,
+                "item": item,
+            })
+        finally:
+            bbgr.close()
 
     except Exception as e:
         return JsonResponse({"ok": False, "error": str(e)}, status=500)